@@ -7,6 +7,7 @@ import requests
 from typing import Dict, Optional, List
 from logger import setup_logger
 from config import Config
+from http_session import get_session
 from tradier_client import TradierTradingClient
 
 logger = setup_logger("CorrectedAlerts")
@@ -31,6 +32,9 @@ class CorrectedMultiStrategyPushoverClient:
         # Track sent alerts to avoid duplicates
         self.sent_alerts = set()
         
+        # Shared keep-alive session (see http_session)
+        self.session = get_session()
+        
         # Strategy-specific emojis and sounds
         self.strategy_emojis = {
             'momentum': '🚀',
@@ -81,8 +85,8 @@ class CorrectedMultiStrategyPushoverClient:
         offset = entry_price - mid
         
         # Check if blackout mode
-        from time_filters import TimeAdaptiveFilters
-        is_blackout = TimeAdaptiveFilters.is_blackout_period()
+        from time_filters import is_blackout_period
+        is_blackout = is_blackout_period()
         mode_flag = " [BLACKOUT MODE]" if is_blackout else ""
         
         # Strategy-specific formatting
@@ -344,7 +348,7 @@ class CorrectedMultiStrategyPushoverClient:
         # Retry logic
         for attempt in range(Config.PUSHOVER_RETRY_ATTEMPTS):
             try:
-                response = requests.post(
+                response = self.session.post(
                     self.api_url,
                     data=payload,
                     timeout=3
@@ -32,7 +32,9 @@ class VWAPExecutionEngine:
         Args:
             agg_data: Real-time aggregate data from Polygon
         """
-        current_time = agg_data.get('t', time.time() * 1000) / 1000
+        # Only read the clock when the aggregate carries no timestamp
+        timestamp_ms = agg_data.get('t')
+        current_time = timestamp_ms / 1000 if timestamp_ms is not None else time.time()
         current_price = agg_data.get('c', 0)
         high_price = agg_data.get('h', current_price)
         low_price = agg_data.get('l', current_price)
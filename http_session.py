@@ -0,0 +1,42 @@
+"""
+Shared HTTP session for the IWM momentum system.
+One pooled requests.Session shared by the Tradier and Pushover clients
+(tradier_client, alerts, test_alert).
+"""
+import threading
+from typing import Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Get the process-wide HTTP session, creating it on first use.
+
+    urllib3 keeps a separate keep-alive pool per host, so one session serves
+    every API. Idempotent GET/DELETE requests retry on 429/5xx honoring
+    Retry-After; POST is never retried so orders and alerts are not resent.
+    Credentials must be passed per request, never set on the session.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                retry = Retry(
+                    total=3,
+                    backoff_factor=0.25,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    allowed_methods=frozenset(['GET', 'DELETE']),
+                    respect_retry_after_header=True,
+                    raise_on_status=False
+                )
+                adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=retry)
+                session = requests.Session()
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                _session = session
+    return _session
@@ -719,23 +719,44 @@ class MultiStrategyOrchestrator:
             'volume': 1000
         }
     
+    # Simulated reference prices used until real-time data is wired in
+    SIMULATED_BASE_PRICES = {
+        'IWM': 245.5,
+        'SPY': 443.0,
+        'QQQ': 380.0
+    }
+    
     def _get_current_market_data_for_symbol(self, symbol: str) -> Optional[Dict]:
         """Get current market data for a specific symbol."""
         # This would get real-time data from Polygon for the specific symbol
         # For now, return simulated data with symbol-specific pricing
-        base_prices = {
-            'IWM': 245.5,
-            'SPY': 443.0,
-            'QQQ': 380.0
-        }
-        
         return {
             'timestamp': time.time(),
-            'price': base_prices.get(symbol, 245.5),
+            'price': self.SIMULATED_BASE_PRICES.get(symbol, 245.5),
             'volume': 1000,
             'symbol': symbol
         }
     
+    def _get_current_market_data_for_symbols(self, symbols) -> Dict[str, Dict]:
+        """
+        Get current market data for several symbols in one call.
+        
+        Returns:
+            Dict of symbol -> market data, sharing one snapshot timestamp
+        """
+        # This would be a single Polygon snapshot request for all symbols
+        timestamp = time.time()
+        base_prices = self.SIMULATED_BASE_PRICES
+        return {
+            symbol: {
+                'timestamp': timestamp,
+                'price': base_prices.get(symbol, 245.5),
+                'volume': 1000,
+                'symbol': symbol
+            }
+            for symbol in symbols
+        }
+    
     def _handle_stock_data(self, data: Dict):
         """Handle stock data from WebSocket."""
         # Update session VWAP
@@ -7,6 +7,7 @@ import time
 import numpy as np
 from typing import Dict, Optional, Tuple, List
 from collections import deque
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from logger import setup_logger
 from config import Config
@@ -14,6 +15,25 @@ from utils import get_et_time
 
 logger = setup_logger("OvernightBiasStrategy")
 
+# Action codes returned by OvernightBiasStrategy.check_exit_conditions_batch
+EXIT_HOLD = 0
+EXIT_CLOSE = 1
+EXIT_SCALE_OUT = 2
+
+# EMA20 smoothing factor
+EMA20_ALPHA = 2.0 / (20 + 1)
+
+
+def ema_update(prev_ema: float, price: float, alpha: float) -> float:
+    """One step of the exponential moving average recurrence."""
+    return prev_ema + alpha * (price - prev_ema)
+
+
+def ema_fold(prev_ema: float, prices: np.ndarray, alpha: float) -> float:
+    """Apply ema_update() over a price array in one vectorized pass."""
+    decay = (1.0 - alpha) ** np.arange(len(prices) - 1, -1, -1, dtype=np.float64)
+    return float(decay[0] * (1.0 - alpha) * prev_ema + alpha * np.dot(decay, prices))
+
 
 class OvernightBiasStrategy:
     """
@@ -25,6 +45,9 @@ class OvernightBiasStrategy:
     - Use VWAP + EMA20 as structural filters
     """
     
+    # Max ticks held by buffered_update() before an early flush
+    TICK_BUFFER_SIZE: int = 4096
+    
     def __init__(self):
         # 12-hour overnight bar data (15:00-03:00 ET)
         self.overnight_bars: deque = deque(maxlen=10)
@@ -38,6 +61,16 @@ class OvernightBiasStrategy:
         self.ema20_data: deque = deque(maxlen=20)
         self.current_ema20: float = 0.0
         
+        # Tick buffer for buffered_update(): columns are timestamp, price, volume
+        self._tick_buf = np.empty((self.TICK_BUFFER_SIZE, 3), dtype=np.float64)
+        self._tick_count: int = 0
+        self._tick_vwap_data: Optional[Dict] = None
+        self._tick_time: Optional[datetime] = None
+        self._tick_second: int = -1
+        self._tick_segment: Optional[Tuple] = None
+        self._buffering: bool = False
+        self._flush_results: List[Dict] = []
+        
         # Strategy state
         self.current_bias: Optional[str] = None  # 'calls', 'puts', or None
         self.bias_confidence: float = 0.0
@@ -145,6 +178,9 @@ class OvernightBiasStrategy:
         Returns:
             Dict with confirmation status
         """
+        if self._buffering:
+            return self._buffer_tick(tick_data, vwap_data)
+        
         current_time = get_et_time()
         
         # Update 5-minute candle
@@ -153,6 +189,86 @@ class OvernightBiasStrategy:
         # Update EMA20
         self._update_ema20(tick_data['price'])
         
+        return self._check_five_minute_entry(current_time, vwap_data)
+    
+    @contextmanager
+    def buffered_update(self):
+        """
+        Buffer update_five_minute_data() calls and apply them in one pass.
+        
+        Inside the block each tick is only recorded and
+        {'status': 'buffered'} is returned. Buffered ticks are folded into
+        the 5-minute candle and EMA20 at once whenever the next tick falls
+        in a different candle, entry window or 5-minute close window, when
+        the buffer is full, and on exit, so every pass runs the entry checks
+        at the ET time and VWAP data of its last tick, as the unbuffered
+        path would. The block receives a new list to which each flush
+        result other than 'waiting' is appended.
+        """
+        self._flush_results = []
+        self._buffering = True
+        try:
+            yield self._flush_results
+        finally:
+            self._buffering = False
+            self._record_flush(self.flush())
+    
+    def _buffer_tick(self, tick_data: Dict, vwap_data: Dict) -> Dict:
+        """Record a tick in the buffer, flushing first at segment boundaries or when full."""
+        current_time = get_et_time()
+        
+        # Segments only change at whole-second boundaries
+        second = int(current_time.timestamp())
+        if second != self._tick_second:
+            segment = self._tick_segment_key(current_time)
+            if self._tick_count and segment != self._tick_segment:
+                self._record_flush(self.flush())
+            self._tick_segment = segment
+            self._tick_second = second
+            self._tick_time = current_time
+        
+        if self._tick_count == self.TICK_BUFFER_SIZE:
+            self._record_flush(self.flush())
+        
+        row = self._tick_buf[self._tick_count]
+        row[0] = tick_data['timestamp']
+        row[1] = tick_data['price']
+        row[2] = tick_data.get('volume', 0)
+        self._tick_count += 1
+        self._tick_vwap_data = vwap_data
+        return {'status': 'buffered', 'bias': self.current_bias}
+    
+    def _tick_segment_key(self, current_time: datetime) -> Tuple:
+        """Candle, entry window and close window a tick at current_time falls in."""
+        minute = current_time.minute
+        return (
+            current_time.hour,
+            minute - minute % 5,
+            self._is_in_entry_window(current_time),
+            self._is_five_minute_close(current_time)
+        )
+    
+    def _record_flush(self, result: Dict):
+        """Keep a flush result unless it is 'waiting'."""
+        if result['status'] != 'waiting':
+            self._flush_results.append(result)
+    
+    def flush(self) -> Dict:
+        """Apply buffered ticks to the candle and EMA20, then run the entry checks."""
+        if self._tick_count == 0:
+            return {'status': 'waiting', 'bias': self.current_bias}
+        
+        ticks = self._tick_buf[:self._tick_count]
+        self._tick_count = 0
+        current_time = self._tick_time
+        
+        self._fold_five_minute_candle(ticks, current_time)
+        self._update_ema20_batch(ticks[:, 1])
+        
+        return self._check_five_minute_entry(current_time, self._tick_vwap_data)
+    
+    def _check_five_minute_entry(self, current_time: datetime, vwap_data: Dict) -> Dict:
+        """Run the entry window and 5-minute close checks."""
         # Check if we're in entry window
         if not self._is_in_entry_window(current_time):
             return {'status': 'outside_window', 'bias': self.current_bias}
@@ -240,6 +356,35 @@ class OvernightBiasStrategy:
             self.current_five_min_candle['close'] = tick_data['price']
             self.current_five_min_candle['volume'] += tick_data.get('volume', 0)
     
+    def _fold_five_minute_candle(self, ticks: np.ndarray, current_time: datetime):
+        """Update current 5-minute candle with a batch of buffered ticks."""
+        prices = ticks[:, 1]
+        high = float(prices.max())
+        low = float(prices.min())
+        close = float(prices[-1])
+        volume = float(ticks[:, 2].sum())
+        
+        if (self.current_five_min_candle is None or 
+            self._is_new_five_minute_candle(current_time)):
+            
+            if self.current_five_min_candle:
+                self.five_min_candles.append(self.current_five_min_candle.copy())
+            
+            self.current_five_min_candle = {
+                'timestamp': float(ticks[0, 0]),
+                'open': float(prices[0]),
+                'high': high,
+                'low': low,
+                'close': close,
+                'volume': volume
+            }
+        else:
+            candle = self.current_five_min_candle
+            candle['high'] = max(candle['high'], high)
+            candle['low'] = min(candle['low'], low)
+            candle['close'] = close
+            candle['volume'] += volume
+    
     def _is_new_five_minute_candle(self, current_time: datetime) -> bool:
         """Check if this is a new 5-minute candle."""
         if not self.current_five_min_candle:
@@ -264,9 +409,18 @@ class OvernightBiasStrategy:
         if len(self.ema20_data) == 1:
             self.current_ema20 = price
         else:
-            # Calculate EMA20
-            alpha = 2.0 / (20 + 1)
-            self.current_ema20 = alpha * price + (1 - alpha) * self.current_ema20
+            self.current_ema20 = ema_update(self.current_ema20, price, EMA20_ALPHA)
+    
+    def _update_ema20_batch(self, prices: np.ndarray):
+        """Update EMA20 with a batch of prices."""
+        if len(self.ema20_data) == 0:
+            self.current_ema20 = float(prices[0])
+            self.ema20_data.append(self.current_ema20)
+            prices = prices[1:]
+        
+        if len(prices):
+            self.ema20_data.extend(prices[-self.ema20_data.maxlen:].tolist())
+            self.current_ema20 = ema_fold(self.current_ema20, prices, EMA20_ALPHA)
     
     def _is_in_entry_window(self, current_time: datetime) -> bool:
         """Check if current time is in entry window."""
@@ -469,6 +623,46 @@ class OvernightBiasStrategy:
         
         return {'action': 'hold', 'position_id': position_id}
     
+    def check_exit_conditions_batch(self, position_data: Dict, prices: np.ndarray,
+                                    vwaps: np.ndarray) -> np.ndarray:
+        """
+        Vectorized check_exit_conditions() for one position over many
+        (price, VWAP) pairs.
+        
+        Returns:
+            int8 array of EXIT_HOLD / EXIT_CLOSE / EXIT_SCALE_OUT per pair
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        vwaps = np.asarray(vwaps, dtype=np.float64)
+        entry_price = position_data['entry_price']
+        trigger_level = position_data.get('trigger_level')
+        bias = position_data['bias']
+        is_calls = bias == 'calls'
+        
+        time_in_position = (get_et_time() - position_data['entry_time']).total_seconds() / 60
+        if time_in_position > self.tier_controls.get('time_stop_minutes', 45):
+            return np.full(prices.shape, EXIT_CLOSE, dtype=np.int8)
+        
+        # Calls profit when price rises, anything else when it falls
+        direction = 1.0 if is_calls else -1.0
+        pnl_pct = direction * (prices - entry_price) / entry_price * 100
+        
+        # Hard exits: back inside trigger range or across VWAP (calls/puts only)
+        if is_calls:
+            hard_exit = (prices < vwaps) & (vwaps > 0)
+            if trigger_level:
+                hard_exit |= prices < trigger_level
+        elif bias == 'puts':
+            hard_exit = (prices > vwaps) & (vwaps > 0)
+            if trigger_level:
+                hard_exit |= prices > trigger_level
+        else:
+            hard_exit = np.zeros(prices.shape, dtype=bool)
+        
+        actions = np.where(hard_exit, EXIT_CLOSE, EXIT_HOLD).astype(np.int8)
+        actions[pnl_pct >= 30] = EXIT_SCALE_OUT
+        return actions
+    
     def _check_hard_exit_conditions(self, position_data: Dict, current_price: float,
                                    vwap_data: Dict) -> Dict:
         """Check hard exit conditions."""
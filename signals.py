@@ -3,7 +3,8 @@ CORRECTED Multi-Strategy Signal Detection for IWM 0DTE System
 Stock trend analysis drives strategies, option contracts are only for alert purposes.
 """
 import time
-from typing import Dict, Tuple, Optional, List
+from types import MappingProxyType
+from typing import ClassVar, Dict, Tuple, Optional, List, Mapping
 from collections import deque
 import numpy as np
 from logger import setup_logger
@@ -50,7 +51,9 @@ class CorrectedMultiStrategySignals:
         Process per-second aggregate from IWM stocks WebSocket.
         ONLY STOCK DATA - no option contract data here.
         """
-        current_time = agg_data.get('t', time.time() * 1000) / 1000
+        # Only read the clock when the aggregate carries no timestamp
+        timestamp_ms = agg_data.get('t')
+        current_time = timestamp_ms / 1000 if timestamp_ms is not None else time.time()
         current_price = agg_data.get('c', 0)
         high_price = agg_data.get('h', current_price)
         low_price = agg_data.get('l', current_price)
@@ -86,7 +89,65 @@ class CorrectedMultiStrategySignals:
         # Set previous close for gap detection (first data point of day)
         if self.previous_close is None and len(self.daily_data) == 1:
             self.previous_close = current_price
-    
+
+    def update_batch(self, vwaps, volumes, closes, highs, lows, timestamps_ms):
+        """
+        Process a batch of per-second aggregates supplied as parallel arrays.
+
+        Equivalent to calling update() once per element with the aggregate
+        fields 'a', 'v', 'c', 'h', 'l' and 't' (in argument order), but skips
+        building an aggregate dict per tick and only materializes the ticks
+        that still fit in the rolling windows.
+        """
+        prices = np.asarray(closes, dtype=float)
+        n = prices.size
+        if n == 0:
+            return
+
+        timestamps = np.asarray(timestamps_ms, dtype=float) / 1000
+        highs = np.asarray(highs, dtype=float)
+        lows = np.asarray(lows, dtype=float)
+        volumes = np.asarray(volumes, dtype=float)
+        vwaps = np.asarray(vwaps, dtype=float)
+
+        # First data point of day sets previous close for gap detection
+        if self.previous_close is None and not self.daily_data:
+            self.previous_close = float(prices[0])
+
+        # Older ticks would be evicted by the deques anyway
+        start = max(0, n - max(self.per_sec_data.maxlen, self.daily_data.maxlen))
+        points = [
+            {
+                'timestamp': ts,
+                'price': price,
+                'high': high,
+                'low': low,
+                'volume': volume,
+                'vwap': vwap
+            }
+            for ts, price, high, low, volume, vwap in zip(
+                timestamps[start:].tolist(), prices[start:].tolist(),
+                highs[start:].tolist(), lows[start:].tolist(),
+                volumes[start:].tolist(), vwaps[start:].tolist()
+            )
+        ]
+
+        self.per_sec_data.extend(points)
+        self.daily_data.extend(points)
+        self.volume_profile.extend(volumes[-self.volume_profile.maxlen:].tolist())
+        self.rsi_data.extend(prices[-self.rsi_data.maxlen:].tolist())
+
+    def reset(self):
+        """Clear all stock data and signal state in place for a fresh session."""
+        self.per_sec_data.clear()
+        self.daily_data.clear()
+        self.volume_profile.clear()
+        self.rsi_data.clear()
+        self.last_signal_time.clear()
+        self.previous_close = None
+
+        logger.info("Signal buffers reset")
+
     def check_all_signals(self) -> Dict[str, Tuple[bool, Dict]]:
         """
         Check all strategies based on STOCK TRENDS ONLY.
@@ -448,8 +509,9 @@ class CorrectedMultiStrategySignals:
         if len(data) < 10:
             return False
         
-        vwaps = np.array([self._calculate_vwap(data[:i+1]) for i in range(len(data))], dtype=float)
-        slope = self._compute_slope(vwaps)
+        prices = np.fromiter((d['price'] for d in data), dtype=float, count=len(data))
+        volumes = np.fromiter((d['volume'] for d in data), dtype=float, count=len(data))
+        slope = self._compute_slope(self._running_vwap(prices, volumes))
         return slope > 0
     
     def _check_volume_surge(self, data: List[Dict]) -> Tuple[bool, float]:
@@ -504,6 +566,19 @@ class CorrectedMultiStrategySignals:
         rsi = 100 - (100 / (1 + rs))
         return rsi
     
+    @staticmethod
+    def _running_vwap(prices: np.ndarray, volumes: np.ndarray) -> np.ndarray:
+        """
+        VWAP of every prefix of the series from running sums of p*v and v.
+        Element i equals _calculate_vwap(data[:i+1]), including the mean-price
+        fallback while cumulative volume is still zero.
+        """
+        cum_vol = np.cumsum(volumes)
+        cum_pv = np.cumsum(prices * volumes)
+        cum_mean = np.cumsum(prices) / np.arange(1, prices.size + 1)
+        has_volume = cum_vol != 0
+        return np.where(has_volume, cum_pv / np.where(has_volume, cum_vol, 1.0), cum_mean)
+    
     @staticmethod
     def _compute_slope(values: np.ndarray) -> float:
         """Compute slope of best-fit line for sequence using least squares."""
@@ -524,6 +599,16 @@ class CorrectedExitMonitor:
     CORRECTED exit monitor that accounts for strategy duration differences.
     """
     
+    # Expected hold duration per strategy (minutes)
+    _DURATIONS: ClassVar[Mapping[str, int]] = MappingProxyType({
+        'momentum': 15,  # 15 minutes average
+        'gap': 30,       # 30 minutes average
+        'volume': 20,    # 20 minutes average
+        'strength': 45,  # 45 minutes average
+        'combined': 30   # 30 minutes for combined strategies
+    })
+    _DEFAULT_DURATION: ClassVar[int] = 30
+    
     def __init__(self):
         self.vwap_below_start: Optional[float] = None
         self.strategy_exits: Dict[str, Dict] = {}
@@ -539,14 +624,7 @@ class CorrectedExitMonitor:
     
     def _get_strategy_duration(self, strategy: str) -> int:
         """Get expected duration for strategy."""
-        durations = {
-            'momentum': 15,  # 15 minutes average
-            'gap': 30,       # 30 minutes average
-            'volume': 20,    # 20 minutes average
-            'strength': 45,  # 45 minutes average
-            'combined': 30   # 30 minutes for combined strategies
-        }
-        return durations.get(strategy, 30)
+        return self._DURATIONS.get(strategy, self._DEFAULT_DURATION)
     
     def should_exit(self, position_data: Dict, market_data: Dict, 
                    strategy: str = 'momentum') -> Tuple[bool, str]:
@@ -41,7 +41,9 @@ class IWM5VWAPSignals:
         Process per-second aggregate from IWM stocks WebSocket.
         ONLY STOCK DATA - no option contract data here.
         """
-        current_time = agg_data.get('t', time.time() * 1000) / 1000
+        # Only read the clock when the aggregate carries no timestamp
+        timestamp_ms = agg_data.get('t')
+        current_time = timestamp_ms / 1000 if timestamp_ms is not None else time.time()
         current_price = agg_data.get('c', 0)
         high_price = agg_data.get('h', current_price)
         low_price = agg_data.get('l', current_price)
@@ -60,13 +60,24 @@ class StrategyConfig:
         }
     }
     
+    # Memoized results of the config-only checks (see invalidate_cache)
+    _cache: Dict[str, Any] = {}
+    
+    @classmethod
+    def invalidate_cache(cls):
+        """Drop memoized results; call after changing config attributes at runtime."""
+        cls._cache.clear()
+    
     @classmethod
     def get_active_strategies(cls) -> Dict[str, bool]:
-        """Get dictionary of active strategies."""
-        return {
-            'vwap': cls.ENABLE_VWAP_STRATEGY,
-            'overnight_bias': cls.ENABLE_OVERNIGHT_BIAS_STRATEGY
-        }
+        """Get dictionary of active strategies (memoized; each call returns a fresh copy)."""
+        cached = cls._cache.get('active_strategies')
+        if cached is None:
+            cached = cls._cache['active_strategies'] = {
+                'vwap': cls.ENABLE_VWAP_STRATEGY,
+                'overnight_bias': cls.ENABLE_OVERNIGHT_BIAS_STRATEGY
+            }
+        return dict(cached)
     
     @classmethod
     def get_strategy_priority(cls, strategy_name: str) -> int:
@@ -108,7 +119,21 @@ class StrategyConfig:
     
     @classmethod
     def validate_config(cls) -> Dict[str, Any]:
-        """Validate strategy configuration."""
+        """Validate strategy configuration (memoized; each call returns a fresh copy)."""
+        cached = cls._cache.get('validation')
+        if cached is None:
+            cached = cls._cache['validation'] = cls._build_validation()
+        return {
+            'valid': cached['valid'],
+            'errors': list(cached['errors']),
+            'warnings': list(cached['warnings']),
+            'active_strategies': dict(cached['active_strategies'])
+        }
+    
+    @classmethod
+    def _build_validation(cls) -> Dict[str, Any]:
+        """Run the configuration checks behind validate_config()."""
+        
         errors = []
         warnings = []
         
@@ -4,25 +4,55 @@ Test Alert Script for IWM-5-VWAP System
 Sends a test alert to verify Pushover configuration.
 """
 import os
+import json
 import requests
 import time
 from datetime import datetime
+from http_session import get_session
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Load environment variables
 from dotenv import load_dotenv
 load_dotenv()
 
+PUSHOVER_URL = "https://api.pushover.net/1/messages.json"
+_TOKEN = os.getenv('PUSHOVER_TOKEN', 'a38bjrx57kf4mprrdgr213bhe7hk61')
+_USER = os.getenv('PUSHOVER_USER_KEY', 'usyhuqctc2s8oa3mk7ksbn5br3b9sy')
+_HAS_CREDS = bool(_TOKEN and _USER)
+_BASE_PAYLOAD = {"token": _TOKEN, "user": _USER}
+_HEADERS = {"Content-Type": "application/json"}
+_SESSION = get_session()
+
+# Minimum spacing between consecutive Pushover sends (seconds)
+_MIN_SEND_INTERVAL = 2.0
+_last_send = 0.0
+
+
+def _post_alert(payload: dict) -> requests.Response:
+    """POST a Pushover payload as JSON, using orjson when it is installed."""
+    global _last_send
+    
+    # Time spent on the previous request counts toward the spacing
+    wait = _MIN_SEND_INTERVAL - (time.monotonic() - _last_send)
+    if wait > 0:
+        time.sleep(wait)
+    
+    body = orjson.dumps(payload) if orjson else json.dumps(payload).encode('utf-8')
+    _last_send = time.monotonic()
+    return _SESSION.post(PUSHOVER_URL, data=body, headers=_HEADERS, timeout=10)
+
+
 def send_test_alert():
     """Send a test alert to verify Pushover configuration."""
     
-    # Get Pushover credentials
-    token = os.getenv('PUSHOVER_TOKEN', 'a38bjrx57kf4mprrdgr213bhe7hk61')
-    user_key = os.getenv('PUSHOVER_USER_KEY', 'usyhuqctc2s8oa3mk7ksbn5br3b9sy')
-    
-    print(f"Pushover Token: {'SET' if token else 'MISSING'}")
-    print(f"Pushover User Key: {'SET' if user_key else 'MISSING'}")
+    print(f"Pushover Token: {'SET' if _TOKEN else 'MISSING'}")
+    print(f"Pushover User Key: {'SET' if _USER else 'MISSING'}")
     
-    if not token or not user_key:
+    if not _HAS_CREDS:
         print("❌ Pushover not configured - cannot send test alert")
         return False
     
@@ -41,8 +71,7 @@ This is a test alert to verify the system is working correctly."""
     
     # Send alert
     payload = {
-        "token": token,
-        "user": user_key,
+        **_BASE_PAYLOAD,
         "title": title,
         "message": message,
         "priority": 1,
@@ -50,7 +79,7 @@ This is a test alert to verify the system is working correctly."""
     }
     
     try:
-        response = requests.post("https://api.pushover.net/1/messages.json", json=payload, timeout=10)
+        response = _post_alert(payload)
         response.raise_for_status()
         
         print("✅ Test alert sent successfully!")
@@ -64,10 +93,7 @@ This is a test alert to verify the system is working correctly."""
 def send_strategy_status_alert():
     """Send current strategy status alert."""
     
-    token = os.getenv('PUSHOVER_TOKEN', 'a38bjrx57kf4mprrdgr213bhe7hk61')
-    user_key = os.getenv('PUSHOVER_USER_KEY', 'usyhuqctc2s8oa3mk7ksbn5br3b9sy')
-    
-    if not token or not user_key:
+    if not _HAS_CREDS:
         print("❌ Pushover not configured")
         return False
     
@@ -87,8 +113,7 @@ System: Render deployment active
 The system is monitoring IWM for VWAP-based signals and will send alerts when conditions are met."""
     
     payload = {
-        "token": token,
-        "user": user_key,
+        **_BASE_PAYLOAD,
         "title": title,
         "message": message,
         "priority": 0,
@@ -96,7 +121,7 @@ The system is monitoring IWM for VWAP-based signals and will send alerts when co
     }
     
     try:
-        response = requests.post("https://api.pushover.net/1/messages.json", json=payload, timeout=10)
+        response = _post_alert(payload)
         response.raise_for_status()
         
         print("✅ Strategy status alert sent!")
@@ -114,9 +139,6 @@ if __name__ == "__main__":
     print("\n1. Sending test alert...")
     test_success = send_test_alert()
     
-    # Wait a moment
-    time.sleep(2)
-    
     # Send strategy status
     print("\n2. Sending strategy status...")
     status_success = send_strategy_status_alert()
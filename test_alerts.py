@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Test script for the Miyagi Pushover alert client
+Tests buy alert delivery, duplicate suppression and the failure path
+against a fake HTTP session (no network access needed).
+"""
+import sys
+import time
+import requests
+from logger import setup_logger
+from alerts import CorrectedMultiStrategyPushoverClient
+
+logger = setup_logger("TestAlerts")
+
+SIGNAL_DATA = {
+    'current_price': 220.50,
+    'vwap_1min': 220.10,
+    'confidence': 0.8,
+    'direction': 'call'
+}
+
+CONTRACT_DATA = {
+    'symbol': 'O:IWM250102C00221000',
+    'strike': 221.0,
+    'delta': 0.35,
+    'iv': 18.5,
+    'mid': 1.20,
+    'spread_pct': 2.0,
+    'bid_size': 50,
+    'ask_size': 40,
+    'contract_type': 'call'
+}
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, status_code, payload):
+        self.status_code = status_code
+        self._payload = payload
+        self.text = str(payload)
+
+    def json(self):
+        return self._payload
+
+
+class FakeSession:
+    """Records Pushover POSTs and answers each with the same response."""
+
+    def __init__(self, status_code=200, payload=None, error=None):
+        self.status_code = status_code
+        self.payload = payload if payload is not None else {'status': 1}
+        self.error = error
+        self.posts = []
+
+    def post(self, url, data=None, timeout=None):
+        self.posts.append(data)
+        if self.error:
+            raise self.error
+        return FakeResponse(self.status_code, self.payload)
+
+
+def make_client(session):
+    """Build a configured client that posts through the fake session."""
+    client = CorrectedMultiStrategyPushoverClient()
+    client.is_configured = True
+    client.session = session
+    return client
+
+
+def send_buy(client):
+    return client.send_buy_alert(SIGNAL_DATA, CONTRACT_DATA, 1.25, 'momentum', execute_trade=False)
+
+
+def test_buy_alert_delivered():
+    """Test a delivered buy alert returns True and is sent once per window."""
+    logger.info("Testing Buy Alert Delivery...")
+
+    session = FakeSession()
+    client = make_client(session)
+
+    if not send_buy(client):
+        logger.error("✗ Delivered buy alert returned False")
+        return False
+
+    # Same alert within the 1-minute window is suppressed, not re-sent
+    if not send_buy(client) or len(session.posts) != 1:
+        logger.error(f"✗ Duplicate buy alert was re-sent ({len(session.posts)} POSTs)")
+        return False
+
+    logger.info("✓ Buy alert delivered once")
+    return True
+
+
+def test_buy_alert_failure():
+    """Test a failed buy alert returns False and is not recorded as sent."""
+    logger.info("Testing Buy Alert Failure Path...")
+
+    original_sleep = time.sleep
+    time.sleep = lambda seconds: None  # skip retry backoff
+    try:
+        http_error = make_client(FakeSession(status_code=500, payload={'status': 0}))
+        api_error = make_client(FakeSession(payload={'status': 0, 'errors': ['invalid token']}))
+        network_error = make_client(FakeSession(error=requests.exceptions.ConnectionError("down")))
+
+        for name, client in (("HTTP 500", http_error), ("API error", api_error),
+                             ("Network error", network_error)):
+            if send_buy(client):
+                logger.error(f"✗ {name}: failed buy alert returned True")
+                return False
+            if client.sent_alerts:
+                logger.error(f"✗ {name}: failed alert recorded as sent")
+                return False
+
+            # A failed alert is retried on the next call
+            attempts = len(client.session.posts)
+            send_buy(client)
+            if len(client.session.posts) != 2 * attempts:
+                logger.error(f"✗ {name}: failed alert was not retried")
+                return False
+    finally:
+        time.sleep = original_sleep
+
+    logger.info("✓ Failed buy alerts reported and retried")
+    return True
+
+
+def test_unconfigured_client():
+    """Test an unconfigured client logs the alert without sending it."""
+    logger.info("Testing Unconfigured Client...")
+
+    session = FakeSession()
+    client = make_client(session)
+    client.is_configured = False
+
+    if not send_buy(client) or session.posts:
+        logger.error("✗ Unconfigured client sent an alert")
+        return False
+
+    logger.info("✓ Unconfigured client only logs alerts")
+    return True
+
+
+def main():
+    """Run all alert tests."""
+    logger.info("Starting Miyagi Alert Tests")
+    logger.info("=" * 50)
+
+    tests = [
+        ("Buy Alert Delivery", test_buy_alert_delivered),
+        ("Buy Alert Failure Path", test_buy_alert_failure),
+        ("Unconfigured Client", test_unconfigured_client),
+    ]
+
+    results = []
+
+    for test_name, test_func in tests:
+        logger.info(f"\nRunning {test_name}...")
+        try:
+            result = test_func()
+            results.append((test_name, result))
+            if result:
+                logger.info(f"✓ {test_name} PASSED")
+            else:
+                logger.error(f"✗ {test_name} FAILED")
+        except Exception as e:
+            logger.error(f"✗ {test_name} ERROR: {e}")
+            results.append((test_name, False))
+
+    # Summary
+    logger.info("\n" + "=" * 50)
+    logger.info("MIYAGI ALERT TEST SUMMARY")
+    logger.info("=" * 50)
+
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+
+    for test_name, result in results:
+        status = "PASS" if result else "FAIL"
+        logger.info(f"{test_name}: {status}")
+
+    logger.info(f"\nOverall: {passed}/{total} tests passed")
+
+    if passed == total:
+        logger.info("🎉 All alert tests passed!")
+        return 0
+    else:
+        logger.error("❌ Some tests failed. Please review the implementation.")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
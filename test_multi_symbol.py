@@ -36,13 +36,14 @@ def test_configuration():
     return True
 
 
-def test_orchestrator_initialization():
+def test_orchestrator_initialization(orchestrator):
     """Test multi-strategy orchestrator initialization."""
     logger.info("Testing Multi-Strategy Orchestrator Initialization...")
     
     try:
-        # Initialize orchestrator
-        orchestrator = MultiStrategyOrchestrator()
+        if orchestrator is None:
+            logger.error("✗ Orchestrator was not initialized")
+            return False
         
         # Check strategy instances
         logger.info(f"Overnight Bias Instances: {list(orchestrator.overnight_bias_instances.keys())}")
@@ -63,13 +64,11 @@ def test_orchestrator_initialization():
         return False
 
 
-def test_symbol_data_handling():
+def test_symbol_data_handling(orchestrator):
     """Test symbol-specific data handling."""
     logger.info("Testing Symbol-Specific Data Handling...")
     
     try:
-        orchestrator = MultiStrategyOrchestrator()
-        
         # Test data for each symbol
         test_symbols = ['IWM', 'SPY', 'QQQ']
         
@@ -89,13 +88,11 @@ def test_symbol_data_handling():
         return False
 
 
-def test_strategy_instances():
+def test_strategy_instances(orchestrator):
     """Test strategy instances for each symbol."""
     logger.info("Testing Strategy Instances...")
     
     try:
-        orchestrator = MultiStrategyOrchestrator()
-        
         # Test Overnight Bias instances
         for symbol in orchestrator.overnight_bias_symbols:
             if symbol not in orchestrator.overnight_bias_instances:
@@ -123,13 +120,11 @@ def test_strategy_instances():
         return False
 
 
-def test_overnight_analysis_simulation():
+def test_overnight_analysis_simulation(orchestrator):
     """Test overnight analysis for multiple symbols."""
     logger.info("Testing Overnight Analysis Simulation...")
     
     try:
-        orchestrator = MultiStrategyOrchestrator()
-        
         # Simulate overnight analysis for each symbol
         for symbol in orchestrator.overnight_bias_symbols:
             logger.info(f"Simulating overnight analysis for {symbol}")
@@ -145,13 +140,11 @@ def test_overnight_analysis_simulation():
         return False
 
 
-def test_position_tracking():
+def test_position_tracking(orchestrator):
     """Test position tracking across multiple symbols."""
     logger.info("Testing Position Tracking...")
     
     try:
-        orchestrator = MultiStrategyOrchestrator()
-        
         # Simulate positions for different symbols
         test_positions = [
             {'strategy': 'overnight_bias', 'symbol': 'IWM', 'bias': 'calls'},
@@ -159,17 +152,24 @@ def test_position_tracking():
             {'strategy': 'vwap', 'symbol': 'IWM', 'bias': 'calls'}
         ]
         
-        for i, position in enumerate(test_positions):
-            position_id = i + 1
-            orchestrator.active_positions[position_id] = position
-            logger.info(f"Added position {position_id}: {position}")
-        
-        # Check position tracking
-        logger.info(f"Total positions: {len(orchestrator.active_positions)}")
+        # Orchestrator is shared across tests - restore positions afterwards
+        saved_positions = dict(orchestrator.active_positions)
         
-        # Get status
-        status = orchestrator.get_strategy_status()
-        logger.info(f"Active positions in status: {status['active_positions']}")
+        try:
+            for i, position in enumerate(test_positions):
+                position_id = i + 1
+                orchestrator.active_positions[position_id] = position
+                logger.info(f"Added position {position_id}: {position}")
+            
+            # Check position tracking
+            logger.info(f"Total positions: {len(orchestrator.active_positions)}")
+            
+            # Get status
+            status = orchestrator.get_strategy_status()
+            logger.info(f"Active positions in status: {status['active_positions']}")
+        finally:
+            orchestrator.active_positions.clear()
+            orchestrator.active_positions.update(saved_positions)
         
         logger.info("✓ Position tracking working across symbols")
         return True
@@ -184,13 +184,20 @@ def main():
     logger.info("Starting Miyagi Multi-Symbol Multi-Strategy Tests")
     logger.info("=" * 60)
     
+    # Build the orchestrator once and share it across tests
+    try:
+        orchestrator = MultiStrategyOrchestrator()
+    except Exception as e:
+        logger.error(f"✗ Orchestrator initialization failed: {e}")
+        orchestrator = None
+    
     tests = [
         ("Configuration", test_configuration),
-        ("Orchestrator Initialization", test_orchestrator_initialization),
-        ("Symbol Data Handling", test_symbol_data_handling),
-        ("Strategy Instances", test_strategy_instances),
-        ("Overnight Analysis Simulation", test_overnight_analysis_simulation),
-        ("Position Tracking", test_position_tracking),
+        ("Orchestrator Initialization", lambda: test_orchestrator_initialization(orchestrator)),
+        ("Symbol Data Handling", lambda: test_symbol_data_handling(orchestrator)),
+        ("Strategy Instances", lambda: test_strategy_instances(orchestrator)),
+        ("Overnight Analysis Simulation", lambda: test_overnight_analysis_simulation(orchestrator)),
+        ("Position Tracking", lambda: test_position_tracking(orchestrator)),
     ]
     
     results = []
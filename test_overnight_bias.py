@@ -5,10 +5,13 @@ Tests the new strategy implementation without running the full system.
 """
 import sys
 import time
+import numpy as np
 from datetime import datetime, timezone
 from logger import setup_logger
-from overnight_bias_strategy import OvernightBiasStrategy
+import overnight_bias_strategy
+from overnight_bias_strategy import OvernightBiasStrategy, EXIT_HOLD, EXIT_CLOSE, EXIT_SCALE_OUT
 from strategy_config import StrategyConfig
+import time_filters
 
 logger = setup_logger("TestOvernightBias")
 
@@ -40,11 +43,6 @@ def test_overnight_bias_detection():
         'volume': 1000000
     }
     
-    # Manually set the time to 3:00 AM to trigger overnight analysis
-    import datetime
-    now = datetime.datetime.now()
-    three_am = now.replace(hour=3, minute=0, second=0, microsecond=0)
-    
     # Mock the time check by temporarily modifying the strategy
     original_method = strategy._is_overnight_bar_complete
     
@@ -130,10 +128,68 @@ def test_five_minute_confirmation():
         logger.info("✓ Entry signal generated")
         logger.info(f"✓ Entry Price: {result['entry_price']}")
         logger.info(f"✓ Trigger Level: {result['trigger_level']}")
-        return True
     else:
         logger.info(f"Status: {result.get('status', 'unknown')}")
         return False
+    
+    # Buffered ticks must give the same signals and state as unbuffered ones,
+    # including across a candle boundary and the :05 close window
+    ticks = [
+        (datetime(2025, 1, 2, 10, 4, 50), 242.00),
+        (datetime(2025, 1, 2, 10, 4, 55), 242.10),
+        (datetime(2025, 1, 2, 10, 5, 5), 242.50),   # new candle, close window
+        (datetime(2025, 1, 2, 10, 5, 20), 242.60),
+        (datetime(2025, 1, 2, 10, 5, 40), 241.50),  # close window over
+        (datetime(2025, 1, 2, 10, 6, 0), 241.40),
+    ]
+    segment_ends = [1, 3, 5]
+    
+    def make_strategy():
+        s = OvernightBiasStrategy()
+        s.current_bias = 'calls'
+        s.overnight_high = 241.93
+        s.overnight_low = 240.19
+        s.ema20_data.extend(241.0 + i * 0.1 for i in range(20))
+        s.current_ema20 = 242.0
+        return s
+    
+    clock = [ticks[0][0]]
+    original_get_et_time = overnight_bias_strategy.get_et_time
+    overnight_bias_strategy.get_et_time = lambda: clock[0]
+    try:
+        unbuffered = make_strategy()
+        unbuffered_results = []
+        for now, price in ticks:
+            clock[0] = now
+            tick = {'timestamp': now.timestamp(), 'price': price, 'volume': 100}
+            unbuffered_results.append(unbuffered.update_five_minute_data(tick, vwap_data))
+        
+        buffered = make_strategy()
+        with buffered.buffered_update() as flush_results:
+            for now, price in ticks:
+                clock[0] = now
+                tick = {'timestamp': now.timestamp(), 'price': price, 'volume': 100}
+                buffered.update_five_minute_data(tick, vwap_data)
+    finally:
+        overnight_bias_strategy.get_et_time = original_get_et_time
+    
+    expected = [unbuffered_results[i] for i in segment_ends
+                if unbuffered_results[i]['status'] != 'waiting']
+    buffered_statuses = [r['status'] for r in flush_results]
+    logger.info(f"Buffered flush results: {buffered_statuses}")
+    
+    if buffered_statuses != [r['status'] for r in expected] or 'entry_signal' not in buffered_statuses:
+        logger.error(f"Buffered results {buffered_statuses} != unbuffered {[r['status'] for r in expected]}")
+        return False
+    
+    if (list(buffered.five_min_candles) != list(unbuffered.five_min_candles) or
+            buffered.current_five_min_candle != unbuffered.current_five_min_candle or
+            not np.isclose(buffered.current_ema20, unbuffered.current_ema20)):
+        logger.error("Buffered candle/EMA20 state differs from unbuffered")
+        return False
+    
+    logger.info("✓ Buffered updates match unbuffered updates")
+    return True
 
 
 def test_position_sizing():
@@ -167,35 +223,66 @@ def test_exit_conditions():
     strategy = OvernightBiasStrategy()
     
     # Simulate position data
-    position_data = {
+    calls_position = {
         'position_id': 1,
         'bias': 'calls',
         'entry_price': 242.50,
         'entry_time': datetime.now(timezone.utc),
         'trigger_level': 241.93
     }
+    puts_position = dict(calls_position, position_id=2, bias='puts', trigger_level=240.19)
+    neutral_position = dict(calls_position, position_id=3, bias=None)
     
     # Test different exit scenarios
     scenarios = [
-        {'price': 245.00, 'vwap': 244.00, 'expected': 'hold'},  # Profit, hold
-        {'price': 240.00, 'vwap': 241.00, 'expected': 'close'},  # Back inside trigger
-        {'price': 243.00, 'vwap': 244.00, 'expected': 'close'},  # VWAP cross
+        {'position': calls_position, 'price': 245.00, 'vwap': 244.00, 'expected': 'hold'},  # Profit, hold
+        {'position': calls_position, 'price': 240.00, 'vwap': 241.00, 'expected': 'close'},  # Back inside trigger
+        {'position': calls_position, 'price': 243.00, 'vwap': 244.00, 'expected': 'close'},  # VWAP cross
+        {'position': calls_position, 'price': 320.00, 'vwap': 300.00, 'expected': 'scale_out'},  # +32%
+        {'position': puts_position, 'price': 239.00, 'vwap': 240.00, 'expected': 'hold'},
+        {'position': puts_position, 'price': 241.00, 'vwap': 242.00, 'expected': 'close'},  # Back inside trigger
+        {'position': puts_position, 'price': 239.50, 'vwap': 239.00, 'expected': 'close'},  # VWAP cross
+        {'position': puts_position, 'price': 160.00, 'vwap': 170.00, 'expected': 'scale_out'},  # +34%
+        {'position': neutral_position, 'price': 250.00, 'vwap': 260.00, 'expected': 'hold'},  # No hard exits
     ]
+    action_codes = {'hold': EXIT_HOLD, 'close': EXIT_CLOSE, 'scale_out': EXIT_SCALE_OUT}
     
     for i, scenario in enumerate(scenarios):
+        position_data = scenario['position']
         vwap_data = {'current_vwap': scenario['vwap']}
         result = strategy.check_exit_conditions(
             position_data, scenario['price'], vwap_data
         )
         
-        logger.info(f"Scenario {i+1}: Price {scenario['price']}, VWAP {scenario['vwap']}")
+        logger.info(f"Scenario {i+1}: {position_data['bias']} Price {scenario['price']}, VWAP {scenario['vwap']}")
         logger.info(f"  Result: {result['action']} - {result.get('reason', 'N/A')}")
         
         if result['action'] == scenario['expected']:
             logger.info("  ✓ Correct exit decision")
         else:
-            logger.warning(f"  ⚠ Expected {scenario['expected']}, got {result['action']}")
+            logger.error(f"  ✗ Expected {scenario['expected']}, got {result['action']}")
+            return False
+        
+        # Vectorized check must agree with the scalar one
+        actions = strategy.check_exit_conditions_batch(
+            position_data, np.array([scenario['price']]), np.array([scenario['vwap']])
+        )
+        if actions.tolist() != [action_codes[result['action']]]:
+            logger.error(f"  ✗ Batch expected {action_codes[result['action']]}, got {actions.tolist()}")
+            return False
+    
+    # Vectorized check over all calls scenarios at once
+    calls_scenarios = [s for s in scenarios if s['position'] is calls_position]
+    prices = np.array([s['price'] for s in calls_scenarios])
+    vwaps = np.array([s['vwap'] for s in calls_scenarios])
+    actions = strategy.check_exit_conditions_batch(calls_position, prices, vwaps)
+    expected = [action_codes[s['expected']] for s in calls_scenarios]
+    
+    if actions.tolist() != expected:
+        logger.error(f"✗ Batch expected {expected}, got {actions.tolist()}")
+        return False
     
+    logger.info("✓ Batch exit decisions match")
     return True
 
 
@@ -229,6 +316,34 @@ def test_strategy_config():
     return validation['valid']
 
 
+def test_time_periods():
+    """Test that every minute of the day maps to a known time period."""
+    logger.info("Testing Time Periods...")
+    
+    original_get_et_time = time_filters.get_et_time
+    base = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    periods = set()
+    
+    try:
+        for minute in range(24 * 60):
+            now = base.replace(hour=minute // 60, minute=minute % 60)
+            time_filters.get_et_time = lambda: now
+            time_filters._period_cache = (-1, 'standard')
+            periods.add(time_filters.get_current_period())
+    finally:
+        time_filters.get_et_time = original_get_et_time
+        time_filters._period_cache = (-1, 'standard')
+    
+    logger.info(f"Periods seen: {sorted(periods)}")
+    
+    if periods == set(time_filters.MULTIPLIERS):
+        logger.info("✓ All periods valid")
+        return True
+    
+    logger.error(f"✗ Unexpected periods: {periods - set(time_filters.MULTIPLIERS)}")
+    return False
+
+
 def main():
     """Run all tests."""
     logger.info("Starting Miyagi Overnight Bias Strategy Tests")
@@ -240,6 +355,7 @@ def main():
         ("Position Sizing", test_position_sizing),
         ("Exit Conditions", test_exit_conditions),
         ("Strategy Configuration", test_strategy_config),
+        ("Time Periods", test_time_periods),
     ]
     
     results = []
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Test script for Miyagi signal data ingestion
+Checks that batched aggregate updates match per-aggregate updates.
+"""
+import sys
+import time
+import numpy as np
+from logger import setup_logger
+from signals import CorrectedMultiStrategySignals
+
+logger = setup_logger("TestSignals")
+
+STATE_FIELDS = ('per_sec_data', 'daily_data', 'volume_profile', 'rsi_data')
+
+
+def make_aggregates(n, seed=7):
+    """Build n per-second aggregates as parallel arrays (a, v, c, h, l, t)."""
+    rng = np.random.default_rng(seed)
+    closes = 220.0 + np.cumsum(rng.normal(0, 0.05, n))
+    highs = closes + rng.uniform(0, 0.05, n)
+    lows = closes - rng.uniform(0, 0.05, n)
+    volumes = rng.integers(100, 5000, n).astype(float)
+    vwaps = closes + rng.normal(0, 0.02, n)
+    timestamps_ms = 1_735_828_200_000 + 1000 * np.arange(n)
+    return vwaps, volumes, closes, highs, lows, timestamps_ms
+
+
+def update_one_by_one(signals, arrays):
+    """Feed the aggregates through update() one dict at a time."""
+    for a, v, c, h, l_, t in zip(*(arr.tolist() for arr in arrays)):
+        signals.update({'a': a, 'v': v, 'c': c, 'h': h, 'l': l_, 't': t})
+
+
+def states_match(expected, actual):
+    """Compare the rolling windows and previous close of two signal objects."""
+    for field in STATE_FIELDS:
+        if list(getattr(expected, field)) != list(getattr(actual, field)):
+            logger.error(f"✗ {field} differs")
+            return False
+    if expected.previous_close != actual.previous_close:
+        logger.error(f"✗ previous_close differs: {expected.previous_close} != {actual.previous_close}")
+        return False
+    return True
+
+
+def derived_state(signals):
+    """Values computed from the rolling windows and signal tracking."""
+    data = list(signals.per_sec_data)
+    return (signals._calculate_rsi(), signals._calculate_vwap(data),
+            signals._check_vwap_rising(data), signals._is_cooldown_active('vwap'))
+
+
+def test_update_batch():
+    """Test update_batch() matches repeated update() calls."""
+    logger.info("Testing Batched Updates...")
+
+    # Sizes below, at and above the largest rolling window (1200)
+    for n in (1, 50, 1200, 2500):
+        arrays = make_aggregates(n)
+
+        expected = CorrectedMultiStrategySignals()
+        update_one_by_one(expected, arrays)
+
+        # One batch
+        batched = CorrectedMultiStrategySignals()
+        batched.update_batch(*arrays)
+        if not states_match(expected, batched):
+            logger.error(f"✗ Single batch of {n} differs from update()")
+            return False
+
+        # Split across two batches
+        split = CorrectedMultiStrategySignals()
+        cut = n // 3
+        split.update_batch(*(arr[:cut] for arr in arrays))
+        split.update_batch(*(arr[cut:] for arr in arrays))
+        if not states_match(expected, split):
+            logger.error(f"✗ Two batches of {n} differ from update()")
+            return False
+
+    # An empty batch changes nothing
+    empty = CorrectedMultiStrategySignals()
+    empty.update_batch(*(arr[:0] for arr in make_aggregates(10)))
+    if empty.per_sec_data or empty.previous_close is not None:
+        logger.error("✗ Empty batch changed state")
+        return False
+
+    logger.info("✓ Batched updates match per-aggregate updates")
+    return True
+
+
+def test_reset():
+    """Test reset() returns a used detector to the state of a fresh one."""
+    logger.info("Testing Reset...")
+
+    arrays = make_aggregates(1500)
+    fresh = CorrectedMultiStrategySignals()
+
+    used = CorrectedMultiStrategySignals()
+    used.update_batch(*arrays)
+    used.last_signal_time['vwap'] = time.time()
+    if derived_state(used) == derived_state(fresh) or used.previous_close is None:
+        logger.error("✗ Detector was not filled before reset")
+        return False
+
+    used.reset()
+    if not states_match(fresh, used) or derived_state(used) != derived_state(fresh):
+        logger.error("✗ Reset detector differs from a fresh one")
+        return False
+    for field in STATE_FIELDS:
+        if getattr(used, field).maxlen != getattr(fresh, field).maxlen:
+            logger.error(f"✗ {field} window size changed by reset")
+            return False
+
+    # Derived state after new data matches a fresh detector fed the same data
+    arrays = make_aggregates(300, seed=11)
+    used.update_batch(*arrays)
+    fresh.update_batch(*arrays)
+    if not states_match(fresh, used) or derived_state(used) != derived_state(fresh):
+        logger.error("✗ Reset detector diverges from a fresh one on new data")
+        return False
+
+    logger.info("✓ Reset detector matches a fresh one")
+    return True
+
+
+def main():
+    """Run all signal tests."""
+    logger.info("Starting Miyagi Signal Tests")
+    logger.info("=" * 50)
+
+    tests = [
+        ("Batched Updates", test_update_batch),
+        ("Reset", test_reset),
+    ]
+
+    results = []
+
+    for test_name, test_func in tests:
+        logger.info(f"\nRunning {test_name}...")
+        try:
+            result = test_func()
+            results.append((test_name, result))
+            if result:
+                logger.info(f"✓ {test_name} PASSED")
+            else:
+                logger.error(f"✗ {test_name} FAILED")
+        except Exception as e:
+            logger.error(f"✗ {test_name} ERROR: {e}")
+            results.append((test_name, False))
+
+    # Summary
+    logger.info("\n" + "=" * 50)
+    logger.info("MIYAGI SIGNAL TEST SUMMARY")
+    logger.info("=" * 50)
+
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+
+    for test_name, result in results:
+        status = "PASS" if result else "FAIL"
+        logger.info(f"{test_name}: {status}")
+
+    logger.info(f"\nOverall: {passed}/{total} tests passed")
+
+    if passed == total:
+        logger.info("🎉 All signal tests passed!")
+        return 0
+    else:
+        logger.error("❌ Some tests failed. Please review the implementation.")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Test script for Miyagi utility functions
+Checks the fast paths in utils.py against their reference behavior.
+"""
+import sys
+import numpy as np
+from datetime import datetime
+from logger import setup_logger
+from utils import (
+    format_contract_symbol, parse_contract_symbol,
+    determine_aggressor_side, determine_aggressor_side_batch
+)
+
+logger = setup_logger("TestUtils")
+
+
+def test_contract_symbols():
+    """Test OCC contract symbol formatting and parsing."""
+    logger.info("Testing Contract Symbols...")
+
+    # Formatting matches the strptime/strftime reference, padded or not
+    for expiry in ('2025-10-02', '2025-1-2', '2024-02-29', '2030-12-31'):
+        expected = f"O:IWM{datetime.strptime(expiry, '%Y-%m-%d').strftime('%y%m%d')}C00210000"
+        symbol = format_contract_symbol('IWM', expiry, 210.0)
+        if symbol != expected:
+            logger.error(f"✗ format_contract_symbol({expiry!r}) = {symbol}, expected {expected}")
+            return False
+
+    # Malformed or impossible expiries raise instead of producing a bad symbol
+    for expiry in ('20251002', '2025-13-02', '2025-02-30', '2025/10/02', '25-10-02'):
+        try:
+            symbol = format_contract_symbol('IWM', expiry, 210.0)
+        except ValueError:
+            continue
+        logger.error(f"✗ format_contract_symbol({expiry!r}) returned {symbol}, expected ValueError")
+        return False
+
+    # Round trip
+    symbol = format_contract_symbol('IWM', '2025-10-02', 210.5, 'P')
+    parsed = parse_contract_symbol(symbol)
+    if parsed != ('IWM', '2025-10-02', 210.5, 'P'):
+        logger.error(f"✗ parse_contract_symbol({symbol}) = {parsed}")
+        return False
+
+    # Invalid symbols parse to None
+    for symbol in ('O:IWM251302C00210000', 'O:IWM250230C00210000', 'O:IWM25A002C00210000',
+                   'O:IWM251002C', 'O:IWM'):
+        parsed = parse_contract_symbol(symbol)
+        if parsed is not None:
+            logger.error(f"✗ parse_contract_symbol({symbol}) = {parsed}, expected None")
+            return False
+
+    logger.info("✓ Contract symbols formatted and parsed correctly")
+    return True
+
+
+def test_aggressor_side_batch():
+    """Test determine_aggressor_side_batch() matches the scalar version."""
+    logger.info("Testing Aggressor Side Batch...")
+
+    codes = {'buy': 1, 'sell': -1, 'mid': 0}
+    rng = np.random.default_rng(11)
+    n = 2000
+    bids = np.round(rng.uniform(1.0, 5.0, n), 2)
+    asks = np.round(bids + rng.uniform(0.01, 0.30, n), 2)
+    prices = np.round(rng.uniform(bids - 0.10, asks + 0.10), 2)
+
+    # Crossed and locked quotes, and trades exactly half a tick from the quote
+    bids = np.append(bids, [2.00, 2.00, 2.00, 2.00])
+    asks = np.append(asks, [1.90, 2.00, 2.10, 2.10])
+    prices = np.append(prices, [1.95, 2.00, 2.075, 2.025])
+
+    expected = [codes[determine_aggressor_side(p, b, a)] for p, b, a in zip(prices, bids, asks)]
+    actual = determine_aggressor_side_batch(prices, bids, asks)
+
+    if actual.dtype != np.int8 or actual.tolist() != expected:
+        mismatches = int(np.sum(actual != np.array(expected)))
+        logger.error(f"✗ Batch aggressor side differs from scalar on {mismatches} trades")
+        return False
+
+    logger.info("✓ Batch aggressor side matches scalar version")
+    return True
+
+
+def main():
+    """Run all utility tests."""
+    logger.info("Starting Miyagi Utility Tests")
+    logger.info("=" * 50)
+
+    tests = [
+        ("Contract Symbols", test_contract_symbols),
+        ("Aggressor Side Batch", test_aggressor_side_batch),
+    ]
+
+    results = []
+
+    for test_name, test_func in tests:
+        logger.info(f"\nRunning {test_name}...")
+        try:
+            result = test_func()
+            results.append((test_name, result))
+            if result:
+                logger.info(f"✓ {test_name} PASSED")
+            else:
+                logger.error(f"✗ {test_name} FAILED")
+        except Exception as e:
+            logger.error(f"✗ {test_name} ERROR: {e}")
+            results.append((test_name, False))
+
+    # Summary
+    logger.info("\n" + "=" * 50)
+    logger.info("MIYAGI UTILITY TEST SUMMARY")
+    logger.info("=" * 50)
+
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+
+    for test_name, result in results:
+        status = "PASS" if result else "FAIL"
+        logger.info(f"{test_name}: {status}")
+
+    logger.info(f"\nOverall: {passed}/{total} tests passed")
+
+    if passed == total:
+        logger.info("🎉 All utility tests passed!")
+        return 0
+    else:
+        logger.error("❌ Some tests failed. Please review the implementation.")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
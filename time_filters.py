@@ -2,140 +2,218 @@
 Time-adaptive filtering for different market periods.
 Adjusts signal thresholds based on time of day to improve accuracy.
 """
-from datetime import time
-from typing import Dict
+import logging
+import time
+from datetime import time as dt_time
+from typing import Dict, Optional, Tuple
 from utils import get_et_time
 from logger import setup_logger
 
 logger = setup_logger("TimeFilters")
 
+# Period only changes at fixed boundaries, so it is memoized per wall-clock
+# second as (second, period). Caches are tuples replaced in one assignment
+# so concurrent readers never see a half-updated entry.
+_period_cache: Tuple[int, str] = (-1, 'standard')
 
-class TimeAdaptiveFilters:
-    """Adjust signal thresholds based on market microstructure by time of day."""
-    
-    # Time period definitions (ET)
-    BLACKOUT_OPENING_START = time(9, 30)
-    BLACKOUT_OPENING_END = time(9, 45)
-    
-    BLACKOUT_LUNCH_START = time(11, 30)
-    BLACKOUT_LUNCH_END = time(13, 30)
-    
-    POWER_START = time(15, 0)
-    POWER_END = time(15, 30)
-    
-    # Threshold multipliers by period (EXACT SPEC)
-    MULTIPLIERS = {
-        'blackout': {
-            # BLACKOUT MODE: 9:30-9:45 ET and 11:30-13:30 ET
-            'flow_zscore': 1.75,        # 2.0 → 3.5σ (VERY strict)
-            'ask_side_pct': 1.154,      # 65% → 75% (VERY strict)
-            'spread_max': 0.667,        # 3.0% → 2.0% (much tighter)
-            'volume_percentile': 1.042, # 95th → 99th (very high)
-            'relative_volume': 1.333,   # 1.5× → 2.0× (higher)
-            'skew_point': 1.5,          # 1.0 → 1.5 vol points (stricter)
-            'skew_median_offset': 2.0   # 0.5 → 1.0 above median (stricter)
-        },
-        'power': {
-            # Power hour: standard thresholds
-            'flow_zscore': 1.0,
-            'ask_side_pct': 1.0,
-            'spread_max': 1.0,
-            'volume_percentile': 1.0,
-            'relative_volume': 1.0,
-            'skew_point': 1.0,
-            'skew_median_offset': 1.0
-        },
-        'standard': {
-            # Normal mid-day trading: standard thresholds
-            'flow_zscore': 1.0,
-            'ask_side_pct': 1.0,
-            'spread_max': 1.0,
-            'volume_percentile': 1.0,
-            'relative_volume': 1.0,
-            'skew_point': 1.0,
-            'skew_median_offset': 1.0
-        }
+# Last adjusted thresholds as (period, base thresholds, result), keyed by
+# period and base thresholds identity
+_thresholds_cache: Tuple[Optional[str], Optional[Dict], Optional[Dict]] = (None, None, None)
+
+
+# Time period definitions (ET, seconds since midnight)
+BLACKOUT_OPENING_START_S: int = 9 * 3600 + 30 * 60    # 09:30
+BLACKOUT_OPENING_END_S: int = 9 * 3600 + 45 * 60      # 09:45
+
+BLACKOUT_LUNCH_START_S: int = 11 * 3600 + 30 * 60     # 11:30
+BLACKOUT_LUNCH_END_S: int = 13 * 3600 + 30 * 60       # 13:30
+
+POWER_START_S: int = 15 * 3600                        # 15:00
+POWER_END_S: int = 15 * 3600 + 30 * 60                # 15:30
+
+# Threshold multipliers by period (EXACT SPEC)
+MULTIPLIERS = {
+    'blackout': {
+        # BLACKOUT MODE: 9:30-9:45 ET and 11:30-13:30 ET
+        'flow_zscore': 1.75,        # 2.0 → 3.5σ (VERY strict)
+        'ask_side_pct': 1.154,      # 65% → 75% (VERY strict)
+        'spread_max': 0.667,        # 3.0% → 2.0% (much tighter)
+        'volume_percentile': 1.042, # 95th → 99th (very high)
+        'relative_volume': 1.333,   # 1.5× → 2.0× (higher)
+        'skew_point': 1.5,          # 1.0 → 1.5 vol points (stricter)
+        'skew_median_offset': 2.0   # 0.5 → 1.0 above median (stricter)
+    },
+    'power': {
+        # Power hour: standard thresholds
+        'flow_zscore': 1.0,
+        'ask_side_pct': 1.0,
+        'spread_max': 1.0,
+        'volume_percentile': 1.0,
+        'relative_volume': 1.0,
+        'skew_point': 1.0,
+        'skew_median_offset': 1.0
+    },
+    'standard': {
+        # Normal mid-day trading: standard thresholds
+        'flow_zscore': 1.0,
+        'ask_side_pct': 1.0,
+        'spread_max': 1.0,
+        'volume_percentile': 1.0,
+        'relative_volume': 1.0,
+        'skew_point': 1.0,
+        'skew_median_offset': 1.0
+    }
+}
+
+# Periods whose multipliers are all 1.0 (thresholds pass through unchanged)
+UNIT_PERIODS = frozenset(
+    period for period, multipliers in MULTIPLIERS.items()
+    if all(m == 1.0 for m in multipliers.values())
+)
+
+PERIOD_DESCRIPTIONS = {
+    'blackout': 'BLACKOUT MODE - Opening/Lunch (VERY strict filters)',
+    'power': 'Power hour (standard filters)',
+    'standard': 'Normal trading (standard filters)'
+}
+
+
+def get_current_period() -> str:
+    """
+    Determine current market period based on ET time.
+
+    Returns:
+        Period name: 'blackout', 'power', or 'standard'
+    """
+    global _period_cache
+    sec = int(time.time())
+    cached_sec, cached_period = _period_cache
+    if sec == cached_sec:
+        return cached_period
+
+    now = get_et_time()
+    now_s = now.hour * 3600 + now.minute * 60 + now.second
+
+    # Check blackout windows (opening + lunch)
+    if (BLACKOUT_OPENING_START_S <= now_s < BLACKOUT_OPENING_END_S or
+        BLACKOUT_LUNCH_START_S <= now_s < BLACKOUT_LUNCH_END_S):
+        period = 'blackout'
+    elif POWER_START_S <= now_s < POWER_END_S:
+        period = 'power'
+    else:
+        period = 'standard'
+
+    _period_cache = (sec, period)
+    return period
+
+
+def is_blackout_period() -> bool:
+    """
+    Check if currently in blackout period.
+
+    Returns:
+        True if in blackout window (9:30-9:45 or 11:30-13:30 ET)
+    """
+    return get_current_period() == 'blackout'
+
+
+def get_adjusted_thresholds(base_thresholds: Dict) -> Dict:
+    """
+    Get adjusted thresholds for current market period.
+
+    Periods whose multipliers are all 1.0 return base_thresholds itself,
+    and repeated calls with the same base dict within another period
+    return the same adjusted dict. Either way the result may alias a
+    dict the caller or a previous call holds, so treat it as read-only.
+
+    Args:
+        base_thresholds: Dict with keys like 'flow_zscore', 'ask_side_pct', etc.
+
+    Returns:
+        Adjusted thresholds dict (read-only; may be base_thresholds itself)
+    """
+    global _thresholds_cache
+    period = get_current_period()
+
+    # Log if using non-standard thresholds
+    if period != 'standard' and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Time period: %s - Adjusted thresholds active", period.upper())
+
+    # All multipliers are 1.0 - nothing to adjust
+    if period in UNIT_PERIODS:
+        return base_thresholds
+
+    cached_period, cached_base, cached_result = _thresholds_cache
+    if period == cached_period and base_thresholds is cached_base:
+        return cached_result
+
+    adjusted = _apply_multipliers(base_thresholds, period)
+
+    _thresholds_cache = (period, base_thresholds, adjusted)
+    return adjusted
+
+
+def _apply_multipliers(base_thresholds: Dict, period: str) -> Dict:
+    """Scale base thresholds by the multipliers for a period."""
+    adjusted = dict(base_thresholds)
+    for key, multiplier in MULTIPLIERS[period].items():
+        if key in adjusted:
+            adjusted[key] *= multiplier
+    return adjusted
+
+
+def get_period_info() -> Dict:
+    """
+    Get current period info for logging/debugging.
+
+    Returns:
+        Dict with period, multipliers, and time info
+    """
+    period = get_current_period()
+    now = get_et_time()
+
+    return {
+        'period': period,
+        'time_et': now.strftime('%H:%M:%S ET'),
+        'multipliers': MULTIPLIERS[period],
+        'description': _get_period_description(period)
     }
-    
-    @classmethod
-    def get_current_period(cls) -> str:
-        """
-        Determine current market period based on ET time.
-        
-        Returns:
-            Period name: 'blackout', 'power', or 'standard'
-        """
-        now = get_et_time().time()
-        
-        # Check blackout windows (opening + lunch)
-        if (cls.BLACKOUT_OPENING_START <= now < cls.BLACKOUT_OPENING_END or
-            cls.BLACKOUT_LUNCH_START <= now < cls.BLACKOUT_LUNCH_END):
-            return 'blackout'
-        elif cls.POWER_START <= now < cls.POWER_END:
-            return 'power'
-        else:
-            return 'standard'
-    
-    @classmethod
-    def is_blackout_period(cls) -> bool:
-        """
-        Check if currently in blackout period.
-        
-        Returns:
-            True if in blackout window (9:30-9:45 or 11:30-13:30 ET)
-        """
-        return cls.get_current_period() == 'blackout'
-    
-    @classmethod
-    def get_adjusted_thresholds(cls, base_thresholds: Dict) -> Dict:
-        """
-        Get adjusted thresholds for current market period.
-        
-        Args:
-            base_thresholds: Dict with keys like 'flow_zscore', 'ask_side_pct', etc.
-            
-        Returns:
-            Adjusted thresholds dict
-        """
-        period = cls.get_current_period()
-        multipliers = cls.MULTIPLIERS.get(period, cls.MULTIPLIERS['standard'])
-        
-        adjusted = {}
-        for key, base_value in base_thresholds.items():
-            multiplier = multipliers.get(key, 1.0)
-            adjusted[key] = base_value * multiplier
-        
-        # Log if using non-standard thresholds
-        if period != 'standard':
-            logger.debug(f"Time period: {period.upper()} - Adjusted thresholds active")
-        
-        return adjusted
-    
-    @classmethod
-    def get_period_info(cls) -> Dict:
-        """
-        Get current period info for logging/debugging.
-        
-        Returns:
-            Dict with period, multipliers, and time info
-        """
-        period = cls.get_current_period()
-        now = get_et_time()
-        
-        return {
-            'period': period,
-            'time_et': now.strftime('%H:%M:%S ET'),
-            'multipliers': cls.MULTIPLIERS[period],
-            'description': cls._get_period_description(period)
-        }
-    
-    @classmethod
-    def _get_period_description(cls, period: str) -> str:
-        """Get human-readable description of period."""
-        descriptions = {
-            'blackout': 'BLACKOUT MODE - Opening/Lunch (VERY strict filters)',
-            'power': 'Power hour (standard filters)',
-            'standard': 'Normal trading (standard filters)'
-        }
-        return descriptions.get(period, 'Unknown period')
 
+
+def _get_period_description(period: str) -> str:
+    """Get human-readable description of period."""
+    return PERIOD_DESCRIPTIONS.get(period, 'Unknown period')
+
+
+class TimeAdaptiveFilters:
+    """
+    Backwards-compatible namespace for the module-level time filter
+    functions and constants. New code should call the functions directly.
+    """
+
+    # Time period definitions (ET) as datetime.time, for existing callers
+    BLACKOUT_OPENING_START = dt_time(9, 30)
+    BLACKOUT_OPENING_END = dt_time(9, 45)
+
+    BLACKOUT_LUNCH_START = dt_time(11, 30)
+    BLACKOUT_LUNCH_END = dt_time(13, 30)
+
+    POWER_START = dt_time(15, 0)
+    POWER_END = dt_time(15, 30)
+
+    BLACKOUT_OPENING_START_S = BLACKOUT_OPENING_START_S
+    BLACKOUT_OPENING_END_S = BLACKOUT_OPENING_END_S
+    BLACKOUT_LUNCH_START_S = BLACKOUT_LUNCH_START_S
+    BLACKOUT_LUNCH_END_S = BLACKOUT_LUNCH_END_S
+    POWER_START_S = POWER_START_S
+    POWER_END_S = POWER_END_S
+
+    MULTIPLIERS = MULTIPLIERS
+    UNIT_PERIODS = UNIT_PERIODS
+
+    get_current_period = staticmethod(get_current_period)
+    is_blackout_period = staticmethod(is_blackout_period)
+    get_adjusted_thresholds = staticmethod(get_adjusted_thresholds)
+    get_period_info = staticmethod(get_period_info)
+    _apply_multipliers = staticmethod(_apply_multipliers)
+    _get_period_description = staticmethod(_get_period_description)
@@ -8,13 +8,26 @@ from datetime import datetime, timezone
 import requests
 from logger import setup_logger
 from config import Config
+from http_session import get_session
+from utils import get_et_time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = setup_logger("TradierClient")
 
+# place_order() default: the broker position has not been fetched by the caller
+_NOT_FETCHED = object()
+
 
 class TradierTradingClient:
     """Tradier trading client for executing trades based on signals."""
     
+    # How long positions/account responses are reused before re-fetching
+    CACHE_TTL_SECONDS: float = 2.0
+    
     def __init__(self):
         self.api_key = Config.TRADIER_TOKEN
         self.account_id = Config.TRADIER_ACCOUNT_ID
@@ -27,9 +40,31 @@ class TradierTradingClient:
         self.stop_loss_pct = Config.TRADIER_STOP_LOSS_PCT
         self.take_profit_pct = Config.TRADIER_TAKE_PROFIT_PCT
         
+        # Price multipliers for the percent stop loss / take profit
+        self._sl_mult = 1 - self.stop_loss_pct / 100.0
+        self._tp_mult = 1 + self.take_profit_pct / 100.0
+        
         # Track active positions
         self.active_positions: Dict[str, Dict] = {}
         
+        # Shared pooled session (see http_session); auth is sent per request
+        self.session = get_session()
+        self.headers = {
+            'Authorization': f'Bearer {self.api_key}',
+            'Accept': 'application/json'
+        }
+        self.post_headers = {
+            **self.headers,
+            'Content-Type': 'application/x-www-form-urlencoded'
+        }
+        
+        # Short-lived snapshots of positions/account (see CACHE_TTL_SECONDS),
+        # each published as one (monotonic time, ...) tuple. The cache is per
+        # client and other clients' orders don't invalidate it, so the order
+        # path always reads fresh broker data.
+        self._positions_cache: Optional[Tuple[float, List[Dict], Dict[str, Dict]]] = None
+        self._account_cache: Optional[Tuple[float, Dict]] = None
+        
         # Check if Tradier is properly configured
         self.is_configured = bool(self.api_key and self.account_id and self.enabled)
         
@@ -45,25 +80,22 @@ class TradierTradingClient:
             return None
             
         url = f"{self.base_url}{endpoint}"
-        headers = {
-            'Authorization': f'Bearer {self.api_key}',
-            'Accept': 'application/json'
-        }
         
         try:
             if method.upper() == 'GET':
-                response = requests.get(url, headers=headers, params=data, timeout=10)
+                response = self.session.get(url, headers=self.headers, params=data, timeout=10)
             elif method.upper() == 'POST':
-                headers['Content-Type'] = 'application/x-www-form-urlencoded'
-                response = requests.post(url, headers=headers, data=data, timeout=10)
+                response = self.session.post(url, headers=self.post_headers, data=data, timeout=10)
             elif method.upper() == 'DELETE':
-                response = requests.delete(url, headers=headers, timeout=10)
+                response = self.session.delete(url, headers=self.headers, timeout=10)
             else:
                 logger.error(f"Unsupported HTTP method: {method}")
                 return None
             
             response.raise_for_status()
-            return response.json() if response.content else {}
+            if not response.content:
+                return {}
+            return orjson.loads(response.content) if orjson else response.json()
             
         except requests.exceptions.HTTPError as e:
             logger.error(f"Tradier API error: {e}")
@@ -74,14 +106,27 @@ class TradierTradingClient:
             logger.error(f"Tradier request error: {e}")
             return None
     
-    def get_account_info(self) -> Optional[Dict]:
-        """Get account information."""
-        return self._make_request('GET', f'/v1/accounts/{self.account_id}')
+    def _invalidate_cache(self):
+        """Force the next positions/account call to hit the API."""
+        self._positions_cache = None
+        self._account_cache = None
+    
+    def get_account_info(self, use_cache: bool = True) -> Optional[Dict]:
+        """Get account information (cached for CACHE_TTL_SECONDS unless use_cache is False)."""
+        cached = self._account_cache
+        if (use_cache and cached is not None and
+                time.monotonic() - cached[0] < self.CACHE_TTL_SECONDS):
+            return cached[1]
+        
+        account_info = self._make_request('GET', f'/v1/accounts/{self.account_id}')
+        if account_info is not None:
+            self._account_cache = (time.monotonic(), account_info)
+        return account_info
     
-    def get_cash_balance(self) -> float:
+    def get_cash_balance(self, use_cache: bool = True) -> float:
         """Get available cash balance for trading."""
         try:
-            account_info = self.get_account_info()
+            account_info = self.get_account_info(use_cache)
             if account_info and 'account' in account_info:
                 account = account_info['account']
                 # Get settled cash (available for trading)
@@ -92,24 +137,33 @@ class TradierTradingClient:
             logger.error(f"Error getting cash balance: {e}")
         return 0.0
     
-    def get_positions(self) -> List[Dict]:
-        """Get current positions."""
+    def _get_positions_snapshot(self, use_cache: bool = True) -> Tuple[List[Dict], Dict[str, Dict]]:
+        """Get current positions and a by-symbol index from one cache read or API call."""
+        cached = self._positions_cache
+        if (use_cache and cached is not None and
+                time.monotonic() - cached[0] < self.CACHE_TTL_SECONDS):
+            return cached[1], cached[2]
+        
         response = self._make_request('GET', f'/v1/accounts/{self.account_id}/positions')
-        if response and 'positions' in response:
-            return response['positions'] if response['positions'] else []
-        return []
+        if response is None:
+            return [], {}
+        
+        positions = response.get('positions') or []
+        by_symbol = {p.get('symbol'): p for p in positions if isinstance(p, dict)}
+        self._positions_cache = (time.monotonic(), positions, by_symbol)
+        return positions, by_symbol
+    
+    def get_positions(self, use_cache: bool = True) -> List[Dict]:
+        """Get current positions (cached for CACHE_TTL_SECONDS unless use_cache is False)."""
+        return self._get_positions_snapshot(use_cache)[0]
     
-    def get_position(self, symbol: str) -> Optional[Dict]:
+    def get_position(self, symbol: str, use_cache: bool = True) -> Optional[Dict]:
         """Get specific position for symbol."""
-        positions = self.get_positions()
-        for position in positions:
-            if position.get('symbol') == symbol:
-                return position
-        return None
+        return self._get_positions_snapshot(use_cache)[1].get(symbol)
     
     def place_order(self, symbol: str, qty: int, side: str, order_type: str = 'market',
                    time_in_force: str = 'day', stop_price: Optional[float] = None,
-                   limit_price: Optional[float] = None) -> Optional[Dict]:
+                   limit_price: Optional[float] = None, position=_NOT_FETCHED) -> Optional[Dict]:
         """
         Place a stock order.
         
@@ -121,16 +175,21 @@ class TradierTradingClient:
             time_in_force: 'day', 'gtc', 'ioc', 'fok'
             stop_price: Stop price for stop orders
             limit_price: Limit price for limit orders
+            position: Broker position for symbol (None if flat) when the caller
+                just fetched it; otherwise buys fetch it fresh from the API
         """
         if not self.is_configured:
             logger.warning("Tradier not configured - order not placed")
             return None
         
-        # Check if we already have a position
-        existing_position = self.get_position(symbol)
-        if existing_position and side == 'buy':
-            logger.warning(f"Already have position in {symbol} - skipping buy order")
-            return None
+        # Check if we already have a position (never from the cache, which
+        # misses orders placed through other clients)
+        if side == 'buy':
+            if position is _NOT_FETCHED:
+                position = self.get_position(symbol, use_cache=False)
+            if position:
+                logger.warning(f"Already have position in {symbol} - skipping buy order")
+                return None
         
         order_data = {
             'class': 'equity',
@@ -150,6 +209,7 @@ class TradierTradingClient:
         response = self._make_request('POST', f'/v1/accounts/{self.account_id}/orders', order_data)
         
         if response and 'order' in response:
+            self._invalidate_cache()
             order = response['order']
             logger.info(f"Order placed successfully: {order.get('id', 'Unknown ID')}")
             return order
@@ -161,27 +221,39 @@ class TradierTradingClient:
         """Cancel an order."""
         response = self._make_request('DELETE', f'/v1/accounts/{self.account_id}/orders/{order_id}')
         if response is not None:
+            self._invalidate_cache()
             logger.info(f"Order {order_id} cancelled")
             return True
         else:
             logger.error(f"Failed to cancel order {order_id}")
             return False
     
-    def close_position(self, symbol: str) -> Optional[Dict]:
-        """Close all shares of a position."""
+    def close_position(self, symbol: str, position: Optional[Dict] = None) -> Optional[Dict]:
+        """
+        Close all shares of a position.
+        
+        Args:
+            symbol: Stock symbol
+            position: Broker position dict for symbol, if the caller already has it
+        """
         if not self.is_configured:
             return None
-            
-        position = self.get_position(symbol)
+        
+        if position is None:
+            position = self.get_position(symbol, use_cache=False)
         if not position:
             logger.warning(f"No position found for {symbol}")
             return None
         
-        qty = abs(int(float(position.get('quantity', 0))))
-        side = 'sell' if float(position.get('quantity', 0)) > 0 else 'buy'
+        raw_qty = float(position.get('quantity', 0))
+        qty = abs(int(raw_qty))
+        if qty == 0:
+            logger.warning(f"Position for {symbol} has no whole shares to close")
+            return None
+        side = 'sell' if raw_qty > 0 else 'buy'
         
         logger.info(f"Closing position: {qty} shares of {symbol}")
-        return self.place_order(symbol, qty, side)
+        return self.place_order(symbol, qty, side, position=position)
     
     def execute_signal_trade(self, signal_data: Dict, strategy: str = 'momentum') -> Optional[Dict]:
         """
@@ -195,14 +267,14 @@ class TradierTradingClient:
             logger.info("Tradier not configured - signal trade not executed")
             return None
         
-        # Check if we're at max positions
-        positions = self.get_positions()
+        # Check if we're at max positions (fresh, like every order-path read)
+        positions, positions_by_symbol = self._get_positions_snapshot(use_cache=False)
         if len(positions) >= self.max_positions:
             logger.warning(f"At max positions ({self.max_positions}) - skipping trade")
             return None
         
         # Check available cash balance
-        available_cash = self.get_cash_balance()
+        available_cash = self.get_cash_balance(use_cache=False)
         if available_cash < self.position_size:
             logger.warning(f"Insufficient cash: ${available_cash:.2f} < ${self.position_size:.2f} - skipping trade")
             return None
@@ -229,7 +301,8 @@ class TradierTradingClient:
             symbol=symbol,
             qty=shares,
             side='buy',
-            order_type='market'
+            order_type='market',
+            position=positions_by_symbol.get(symbol)
         )
         
         if order:
@@ -240,9 +313,9 @@ class TradierTradingClient:
                 'qty': shares,
                 'entry_price': current_price,
                 'strategy': strategy,
-                'entry_time': time.time(),
-                'stop_loss': current_price * (1 - self.stop_loss_pct / 100),
-                'take_profit': current_price * (1 + self.take_profit_pct / 100)
+                'entry_time': time.monotonic_ns(),  # monotonic clock, ns
+                'stop_loss': current_price * self._sl_mult,
+                'take_profit': current_price * self._tp_mult
             }
             
             logger.info(f"Trade executed: {shares} shares of {symbol} at ${current_price:.2f}")
@@ -258,7 +331,7 @@ class TradierTradingClient:
         Returns:
             List of closed positions
         """
-        if not self.is_configured:
+        if not self.is_configured or not self.active_positions:
             return []
         
         closed_positions = []
@@ -290,7 +363,7 @@ class TradierTradingClient:
                 if close_order:
                     position['exit_price'] = current_price
                     position['exit_reason'] = exit_reason
-                    position['exit_time'] = time.time()
+                    position['exit_time'] = time.monotonic_ns()
                     
                     # Calculate P&L
                     pnl = (current_price - position['entry_price']) * position['qty']
@@ -305,8 +378,6 @@ class TradierTradingClient:
     
     def _should_exit_time_based(self, position: Dict) -> bool:
         """Check if position should be closed based on time."""
-        from utils import is_market_hours, get_et_time
-        
         # Exit 5 minutes before market close
         current_time = get_et_time()
         if current_time.hour == 15 and current_time.minute >= 55:
@@ -1,39 +1,85 @@
 """
 Utility functions for the IWM momentum system.
 """
-from datetime import datetime, time
+import time as _time
+from functools import lru_cache
+from datetime import date, datetime, time
 from typing import Optional, Tuple
-import pytz
+import numpy as np
 from config import Config
 
+try:
+    from zoneinfo import ZoneInfo
+    _ET = ZoneInfo(Config.TIMEZONE)
+except (ImportError, KeyError):  # Python < 3.9 or no system tz database
+    import pytz
+    _ET = pytz.timezone(Config.TIMEZONE)
+
+# Session times (ET), parsed once from config
+_MARKET_OPEN = time(9, 30)
+_MARKET_CLOSE = time(16, 0)
+_ENTRY_CUTOFF = time(*map(int, Config.NO_ENTRY_AFTER.split(':')))
+_HARD_STOP = time(*map(int, Config.HARD_TIME_STOP.split(':')))
+
+# (epoch second, ET datetime) of the last timezone conversion; replaced
+# as a whole so concurrent readers never see a half-updated entry
+_et_cache: Tuple[int, Optional[datetime]] = (0, None)
+
+# (epoch second, is_market_hours, can_enter_trade, should_force_exit)
+_session_flags_cache: Tuple[int, bool, bool, bool] = (0, False, False, False)
+
+# (ET date, 'YYYY-MM-DD') for get_todays_expiry()
+_expiry_cache: Tuple[Optional[date], str] = (None, '')
+
 
 def get_et_time() -> datetime:
-    """Get current time in Eastern timezone."""
-    return datetime.now(pytz.timezone(Config.TIMEZONE))
+    """
+    Get current time in Eastern timezone.
+    
+    The converted datetime is cached for the current wall-clock second, so
+    callers on the tick path don't repeat the timezone conversion.
+    """
+    global _et_cache
+    now = int(_time.time())
+    cached_sec, cached_time = _et_cache
+    if now == cached_sec:
+        return cached_time
+    et_now = datetime.now(_ET)
+    _et_cache = (now, et_now)
+    return et_now
+
+
+def _session_flags() -> Tuple[int, bool, bool, bool]:
+    """
+    Market-hours, entry and hard-stop flags for the current second.
+    
+    All three are computed together from one ET timestamp and reused until
+    the wall-clock second changes.
+    """
+    global _session_flags_cache
+    flags = _session_flags_cache
+    now = int(_time.time())
+    if now != flags[0]:
+        et_time = get_et_time().time()
+        is_open = _MARKET_OPEN <= et_time <= _MARKET_CLOSE
+        flags = (now, is_open, is_open and et_time < _ENTRY_CUTOFF, et_time >= _HARD_STOP)
+        _session_flags_cache = flags
+    return flags
 
 
 def is_market_hours() -> bool:
     """Check if current time is within regular market hours (9:30-16:00 ET)."""
-    now = get_et_time()
-    market_open = time(9, 30)
-    market_close = time(16, 0)
-    return market_open <= now.time() <= market_close
+    return _session_flags()[1]
 
 
 def can_enter_trade() -> bool:
     """Check if new trades can be entered (before NO_ENTRY_AFTER cutoff)."""
-    now = get_et_time()
-    cutoff_hour, cutoff_minute = map(int, Config.NO_ENTRY_AFTER.split(':'))
-    cutoff = time(cutoff_hour, cutoff_minute)
-    return now.time() < cutoff and is_market_hours()
+    return _session_flags()[2]
 
 
 def should_force_exit() -> bool:
     """Check if we've hit the hard time stop (must exit all positions)."""
-    now = get_et_time()
-    stop_hour, stop_minute = map(int, Config.HARD_TIME_STOP.split(':'))
-    stop_time = time(stop_hour, stop_minute)
-    return now.time() >= stop_time
+    return _session_flags()[3]
 
 
 def get_todays_expiry() -> str:
@@ -41,7 +87,14 @@ def get_todays_expiry() -> str:
     Get today's date in YYYY-MM-DD format (for 0DTE options).
     Uses ET timezone.
     """
-    return get_et_time().strftime('%Y-%m-%d')
+    global _expiry_cache
+    today = get_et_time().date()
+    cached_date, cached_expiry = _expiry_cache
+    if today == cached_date:
+        return cached_expiry
+    expiry = today.isoformat()
+    _expiry_cache = (today, expiry)
+    return expiry
 
 
 def calculate_mid_price(bid: float, ask: float) -> float:
@@ -78,6 +131,28 @@ def determine_aggressor_side(trade_price: float, bid: float, ask: float, tick_si
         return 'mid'
 
 
+def determine_aggressor_side_batch(prices: np.ndarray, bids: np.ndarray, asks: np.ndarray,
+                                   tick_size: float = 0.05) -> np.ndarray:
+    """
+    Vectorized determine_aggressor_side() for a batch of trades.
+    
+    Args:
+        prices: Execution prices
+        bids: NBBO bids at trade time
+        asks: NBBO asks at trade time
+        tick_size: Minimum price increment
+        
+    Returns:
+        int8 array: 1 for 'buy', -1 for 'sell', 0 for 'mid'
+    """
+    half_tick = 0.5 * tick_size
+    buy = np.asarray(prices) >= (np.asarray(asks) - half_tick)
+    sell = np.asarray(prices) <= (np.asarray(bids) + half_tick)
+    # Buy wins when both hold (crossed quote), matching the scalar version
+    return buy.astype(np.int8) - (sell & ~buy).astype(np.int8)
+
+
+@lru_cache(maxsize=256)
 def format_contract_symbol(underlying: str, expiry: str, strike: float, option_type: str = 'C') -> str:
     """
     Format option contract symbol in OCC format.
@@ -91,9 +166,13 @@ def format_contract_symbol(underlying: str, expiry: str, strike: float, option_t
     Returns:
         Formatted contract symbol (e.g., 'O:IWM251002C00210000')
     """
-    # Parse expiry
-    expiry_dt = datetime.strptime(expiry, '%Y-%m-%d')
-    expiry_str = expiry_dt.strftime('%y%m%d')
+    # YYYY-MM-DD -> YYMMDD; other shapes (e.g. unpadded '2025-1-2') go through strptime
+    if (len(expiry) == 10 and expiry[4] == expiry[7] == '-' and
+            expiry[:4].isdigit() and expiry[5:7].isdigit() and expiry[8:].isdigit()):
+        datetime(int(expiry[:4]), int(expiry[5:7]), int(expiry[8:]))  # ValueError on bad month/day
+        expiry_str = expiry[2:4] + expiry[5:7] + expiry[8:]
+    else:
+        expiry_str = datetime.strptime(expiry, '%Y-%m-%d').strftime('%y%m%d')
     
     # Format strike (8 digits: 5 before decimal, 3 after)
     strike_str = f"{int(strike * 1000):08d}"
@@ -122,9 +201,11 @@ def parse_contract_symbol(symbol: str) -> Optional[Tuple[str, str, float, str]]:
         option_type = symbol[9]   # C or P
         strike_str = symbol[10:]  # 8 digits
         
-        # Parse expiry
-        expiry_dt = datetime.strptime(expiry_str, '%y%m%d')
-        expiry_date = expiry_dt.strftime('%Y-%m-%d')
+        # YYMMDD -> YYYY-MM-DD
+        if len(expiry_str) != 6 or not expiry_str.isdigit():
+            raise ValueError(f"Invalid expiry: {expiry_str}")
+        datetime(2000 + int(expiry_str[:2]), int(expiry_str[2:4]), int(expiry_str[4:]))  # ValueError on bad month/day
+        expiry_date = f"20{expiry_str[:2]}-{expiry_str[2:4]}-{expiry_str[4:]}"
         
         # Parse strike
         strike = int(strike_str) / 1000.0
@@ -163,31 +244,29 @@ def interpolate_iv_at_delta(contracts: list, target_delta: float) -> Optional[fl
     if len(contracts) < 2:
         return None
     
-    # Sort by delta
-    sorted_contracts = sorted(contracts, key=lambda x: abs(x.get('delta', 0)))
+    deltas = np.abs(np.fromiter(
+        (c.get('delta', 0) for c in contracts), dtype=np.float64, count=len(contracts)
+    ))
     
-    # Find bracketing contracts
-    lower, upper = None, None
-    for contract in sorted_contracts:
-        delta = abs(contract.get('delta', 0))
-        if delta <= target_delta:
-            lower = contract
-        if delta >= target_delta and upper is None:
-            upper = contract
+    # Sort by delta and find bracketing contracts
+    order = np.argsort(deltas, kind='stable')
+    sorted_deltas = deltas[order]
+    lower_idx = np.searchsorted(sorted_deltas, target_delta, side='right') - 1
+    upper_idx = np.searchsorted(sorted_deltas, target_delta, side='left')
     
-    if lower is None or upper is None:
+    if lower_idx < 0 or upper_idx == len(contracts):
         # Return nearest if exact bracketing not available
-        return min(contracts, key=lambda x: abs(abs(x.get('delta', 0)) - target_delta)).get('implied_volatility')
+        return contracts[int(np.argmin(np.abs(deltas - target_delta)))].get('implied_volatility')
     
     # Linear interpolation
-    lower_delta = abs(lower.get('delta', 0))
-    upper_delta = abs(upper.get('delta', 0))
-    lower_iv = lower.get('implied_volatility', 0)
-    upper_iv = upper.get('implied_volatility', 0)
+    lower_delta = sorted_deltas[lower_idx]
+    upper_delta = sorted_deltas[upper_idx]
+    lower_iv = contracts[order[lower_idx]].get('implied_volatility', 0)
+    upper_iv = contracts[order[upper_idx]].get('implied_volatility', 0)
     
     if upper_delta == lower_delta:
         return lower_iv
     
-    weight = (target_delta - lower_delta) / (upper_delta - lower_delta)
+    weight = float((target_delta - lower_delta) / (upper_delta - lower_delta))
     return lower_iv + weight * (upper_iv - lower_iv)
 
@@ -5,7 +5,11 @@ Verifies all components, symbols, and configurations are working correctly.
 """
 import sys
 import os
+import time
+import logging
+from itertools import chain
 from datetime import datetime
+from typing import Dict, Tuple
 from logger import setup_logger
 from config import Config
 from multi_strategy_orchestrator import MultiStrategyOrchestrator
@@ -15,6 +19,17 @@ from strategy_config import StrategyConfig
 logger = setup_logger("SystemVerification")
 
 
+def build_symbol_index(orchestrator: MultiStrategyOrchestrator) -> Dict[str, Tuple[str, Dict, OvernightBiasStrategy]]:
+    """Map each Overnight Bias symbol to its (tier, expected tier controls, strategy)."""
+    symbol_tiers = orchestrator.symbol_tiers
+    tier_risk_controls = orchestrator.tier_risk_controls
+    symbol_index = {}
+    for symbol, strategy in orchestrator.overnight_bias_instances.items():
+        tier = symbol_tiers.get(symbol, 'tier1')
+        symbol_index[symbol] = (tier, tier_risk_controls.get(tier, {}), strategy)
+    return symbol_index
+
+
 def verify_configuration():
     """Verify all configuration settings."""
     logger.info("🔍 Verifying Configuration...")
@@ -32,129 +47,157 @@ def verify_configuration():
     logger.info(f"Tier Risk Controls: {Config.TIER_RISK_CONTROLS}")
     
     # Verify no duplicate symbols
-    all_symbols = []
-    for tier_symbols in [Config.OVERNIGHT_BIAS_SYMBOLS_TIER1, 
-                        Config.OVERNIGHT_BIAS_SYMBOLS_TIER2, 
-                        Config.OVERNIGHT_BIAS_SYMBOLS_TIER3]:
-        for symbol in tier_symbols:
-            if symbol.strip() in all_symbols:
-                logger.error(f"❌ Duplicate symbol found: {symbol}")
-                return False
-            all_symbols.append(symbol.strip())
+    seen = set()
+    for symbol in chain(Config.OVERNIGHT_BIAS_SYMBOLS_TIER1,
+                        Config.OVERNIGHT_BIAS_SYMBOLS_TIER2,
+                        Config.OVERNIGHT_BIAS_SYMBOLS_TIER3):
+        symbol = symbol.strip()
+        if symbol in seen:
+            logger.error("❌ Duplicate symbol found: %s", symbol)
+            return False
+        seen.add(symbol)
     
-    logger.info(f"✅ Total unique symbols: {len(all_symbols)}")
+    logger.info(f"✅ Total unique symbols: {len(seen)}")
     logger.info("✅ Configuration verification passed")
     return True
 
 
-def verify_symbol_tiers():
+def verify_symbol_tiers(orchestrator: MultiStrategyOrchestrator):
     """Verify symbol tier assignments."""
     logger.info("🔍 Verifying Symbol Tier Assignments...")
-    
-    orchestrator = MultiStrategyOrchestrator()
+    info = logger.info
+    error = logger.error
+    info_enabled = logger.isEnabledFor(logging.INFO)
     
     # Check tier mappings
     logger.info("Symbol Tier Mappings:")
-    for symbol, tier in orchestrator.symbol_tiers.items():
-        logger.info(f"  {symbol}: {tier}")
+    if info_enabled:
+        for symbol, tier in orchestrator.symbol_tiers.items():
+            info("  %s: %s", symbol, tier)
     
     # Verify all active symbols have tier assignments
-    for symbol in orchestrator.overnight_bias_symbols:
-        if symbol not in orchestrator.symbol_tiers:
-            logger.error(f"❌ Symbol {symbol} not found in tier mappings")
-            return False
-        tier = orchestrator.symbol_tiers[symbol]
-        logger.info(f"✅ {symbol} assigned to {tier}")
+    symbol_tiers = orchestrator.symbol_tiers
+    missing = set(orchestrator.overnight_bias_symbols) - symbol_tiers.keys()
+    if missing:
+        for symbol in sorted(missing):
+            error("❌ Symbol %s not found in tier mappings", symbol)
+        return False
+    
+    if info_enabled:
+        for symbol in orchestrator.overnight_bias_symbols:
+            info("✅ %s assigned to %s", symbol, symbol_tiers[symbol])
     
     logger.info("✅ Symbol tier assignments verified")
     return True
 
 
-def verify_strategy_instances():
+def verify_strategy_instances(orchestrator: MultiStrategyOrchestrator, symbol_index: Dict):
     """Verify all strategy instances are properly initialized."""
     logger.info("🔍 Verifying Strategy Instances...")
-    
-    orchestrator = MultiStrategyOrchestrator()
+    info = logger.info
+    error = logger.error
+    info_enabled = logger.isEnabledFor(logging.INFO)
     
     # Check Overnight Bias instances
-    logger.info(f"Overnight Bias Instances: {list(orchestrator.overnight_bias_instances.keys())}")
-    for symbol, strategy in orchestrator.overnight_bias_instances.items():
-        tier = orchestrator.symbol_tiers.get(symbol, 'tier1')
-        tier_controls = orchestrator.tier_risk_controls.get(tier, {})
-        
-        logger.info(f"  {symbol}: tier={tier}, controls={tier_controls}")
-        
-        # Verify tier controls are set
-        if strategy.symbol_tier != tier:
-            logger.error(f"❌ {symbol} tier mismatch: expected {tier}, got {strategy.symbol_tier}")
-            return False
-        
-        if strategy.tier_controls != tier_controls:
-            logger.error(f"❌ {symbol} tier controls mismatch")
-            return False
+    logger.info(f"Overnight Bias Instances: {list(orchestrator.overnight_bias_instances)}")
+    
+    # Verify tier and tier controls are set, checking every symbol before logging
+    mismatches = [
+        symbol for symbol, (tier, tier_controls, strategy) in symbol_index.items()
+        if strategy.symbol_tier != tier or strategy.tier_controls != tier_controls
+    ]
+    if mismatches:
+        for symbol in mismatches:
+            tier, tier_controls, strategy = symbol_index[symbol]
+            if strategy.symbol_tier != tier:
+                error("❌ %s tier mismatch: expected %s, got %s", symbol, tier, strategy.symbol_tier)
+            else:
+                error("❌ %s tier controls mismatch", symbol)
+        return False
+    
+    if info_enabled:
+        for symbol, (tier, tier_controls, _) in symbol_index.items():
+            info("  %s: tier=%s, controls=%s", symbol, tier, tier_controls)
     
     # Check VWAP instances
-    logger.info(f"VWAP Instances: {list(orchestrator.vwap_instances.keys())}")
-    for symbol, components in orchestrator.vwap_instances.items():
-        logger.info(f"  {symbol}: {list(components.keys())}")
+    logger.info(f"VWAP Instances: {list(orchestrator.vwap_instances)}")
+    if info_enabled:
+        for symbol, components in orchestrator.vwap_instances.items():
+            info("  %s: %s", symbol, list(components))
     
     logger.info("✅ Strategy instances verified")
     return True
 
 
-def verify_symbol_data_handling():
+def verify_symbol_data_handling(orchestrator: MultiStrategyOrchestrator):
     """Verify symbol-specific data handling."""
     logger.info("🔍 Verifying Symbol Data Handling...")
-    
-    orchestrator = MultiStrategyOrchestrator()
+    info = logger.info
+    error = logger.error
+    info_enabled = logger.isEnabledFor(logging.INFO)
     
     # Test data for each active symbol
-    test_symbols = orchestrator.overnight_bias_symbols + orchestrator.vwap_strategy_symbols
-    unique_symbols = list(set(test_symbols))
+    unique_symbols = set(orchestrator.overnight_bias_symbols) | set(orchestrator.vwap_strategy_symbols)
+    
+    market_data = orchestrator._get_current_market_data_for_symbols(unique_symbols)
     
     for symbol in unique_symbols:
-        data = orchestrator._get_current_market_data_for_symbol(symbol)
+        data = market_data.get(symbol)
         if not data or 'symbol' not in data:
-            logger.error(f"❌ Invalid data for {symbol}")
+            error("❌ Invalid data for %s", symbol)
             return False
         
-        logger.info(f"✅ {symbol} data: {data}")
+        if info_enabled:
+            info("✅ %s data: %s", symbol, data)
     
     logger.info("✅ Symbol data handling verified")
     return True
 
 
-def verify_tier_controls():
-    """Verify tier-specific controls are working."""
-    logger.info("🔍 Verifying Tier Controls...")
-    
-    orchestrator = MultiStrategyOrchestrator()
-    
-    # Test tier controls for each symbol
+def verify_tier_controls_and_time_stops(orchestrator: MultiStrategyOrchestrator, symbol_index: Dict):
+    """Verify tier-specific controls and time stops in one pass."""
+    logger.info("🔍 Verifying Tier Controls and Time Stops...")
+    info = logger.info
+    error = logger.error
+    info_enabled = logger.isEnabledFor(logging.INFO)
+    
+    # Test tier controls and time stops for each symbol
     for symbol in orchestrator.overnight_bias_symbols:
-        strategy = orchestrator.overnight_bias_instances[symbol]
-        tier = orchestrator.symbol_tiers.get(symbol, 'tier1')
-        expected_controls = orchestrator.tier_risk_controls.get(tier, {})
+        tier, expected_controls, strategy = symbol_index[symbol]
+        strategy_controls = strategy.tier_controls
         
-        logger.info(f"Testing {symbol} ({tier}):")
-        logger.info(f"  Max Positions: {strategy.tier_controls.get('max_positions', 'N/A')}")
-        logger.info(f"  Position Multiplier: {strategy.tier_controls.get('position_size_multiplier', 'N/A')}")
-        logger.info(f"  Time Stop: {strategy.tier_controls.get('time_stop_minutes', 'N/A')} min")
+        if info_enabled:
+            info("Testing %s (%s):", symbol, tier)
+            info("  Max Positions: %s", strategy_controls.get('max_positions', 'N/A'))
+            info("  Position Multiplier: %s", strategy_controls.get('position_size_multiplier', 'N/A'))
+            info("  Time Stop: %s min", strategy_controls.get('time_stop_minutes', 'N/A'))
         
         # Verify controls match expected
-        if strategy.tier_controls != expected_controls:
-            logger.error(f"❌ {symbol} controls mismatch")
+        if strategy_controls != expected_controls:
+            error("❌ %s controls mismatch", symbol)
+            return False
+        
+        expected_time_stop = expected_controls.get('time_stop_minutes', 45)
+        actual_time_stop = strategy_controls.get('time_stop_minutes', 45)
+        
+        if info_enabled:
+            info("%s (%s): Expected %smin, Got %smin", symbol, tier, expected_time_stop, actual_time_stop)
+        
+        if actual_time_stop != expected_time_stop:
+            error("❌ %s time stop mismatch", symbol)
             return False
     
     logger.info("✅ Tier controls verified")
+    logger.info("✅ Time stops verified")
     return True
 
 
-def verify_position_sizing():
+def verify_position_sizing(symbol_index: Dict):
     """Verify tier-specific position sizing."""
     logger.info("🔍 Verifying Position Sizing...")
-    
-    orchestrator = MultiStrategyOrchestrator()
+    info = logger.info
+    error = logger.error
+    info_enabled = logger.isEnabledFor(logging.INFO)
     
     # Test position sizing for each tier
     test_contracts = [
@@ -163,58 +206,38 @@ def verify_position_sizing():
         {'price': 3.20, 'symbol': 'QQQ'}
     ]
     
+    # Multiplier and adjusted account depend only on the tier
+    base_account = 7000.0
+    tier_sizing = {}
+    for tier, tier_controls, _ in symbol_index.values():
+        if tier not in tier_sizing:
+            tier_multiplier = tier_controls.get('position_size_multiplier', 1.0)
+            tier_sizing[tier] = (tier_multiplier, base_account * tier_multiplier)
+    
     for contract in test_contracts:
         symbol = contract['symbol']
-        if symbol in orchestrator.overnight_bias_instances:
-            strategy = orchestrator.overnight_bias_instances[symbol]
-            tier = orchestrator.symbol_tiers.get(symbol, 'tier1')
-            tier_controls = orchestrator.tier_risk_controls.get(tier, {})
+        if symbol in symbol_index:
+            tier, _, strategy = symbol_index[symbol]
+            tier_multiplier, adjusted_account = tier_sizing[tier]
             
             # Calculate position size
-            base_account = 7000.0
-            tier_multiplier = tier_controls.get('position_size_multiplier', 1.0)
-            adjusted_account = base_account * tier_multiplier
-            
             position_size = strategy.calculate_position_size(contract['price'], adjusted_account)
             
-            logger.info(f"{symbol} ({tier}):")
-            logger.info(f"  Base Account: ${base_account}")
-            logger.info(f"  Tier Multiplier: {tier_multiplier}")
-            logger.info(f"  Adjusted Account: ${adjusted_account}")
-            logger.info(f"  Position Size: {position_size}")
+            if info_enabled:
+                info("%s (%s):", symbol, tier)
+                info("  Base Account: $%s", base_account)
+                info("  Tier Multiplier: %s", tier_multiplier)
+                info("  Adjusted Account: $%s", adjusted_account)
+                info("  Position Size: %s", position_size)
             
             if position_size['status'] != 'approved':
-                logger.error(f"❌ {symbol} position sizing failed: {position_size['reason']}")
+                error("❌ %s position sizing failed: %s", symbol, position_size['reason'])
                 return False
     
     logger.info("✅ Position sizing verified")
     return True
 
 
-def verify_time_stops():
-    """Verify tier-specific time stops."""
-    logger.info("🔍 Verifying Time Stops...")
-    
-    orchestrator = MultiStrategyOrchestrator()
-    
-    # Test time stops for each tier
-    for symbol in orchestrator.overnight_bias_symbols:
-        strategy = orchestrator.overnight_bias_instances[symbol]
-        tier = orchestrator.symbol_tiers.get(symbol, 'tier1')
-        expected_time_stop = orchestrator.tier_risk_controls.get(tier, {}).get('time_stop_minutes', 45)
-        
-        actual_time_stop = strategy.tier_controls.get('time_stop_minutes', 45)
-        
-        logger.info(f"{symbol} ({tier}): Expected {expected_time_stop}min, Got {actual_time_stop}min")
-        
-        if actual_time_stop != expected_time_stop:
-            logger.error(f"❌ {symbol} time stop mismatch")
-            return False
-    
-    logger.info("✅ Time stops verified")
-    return True
-
-
 def verify_strategy_config():
     """Verify strategy configuration."""
     logger.info("🔍 Verifying Strategy Configuration...")
@@ -235,12 +258,10 @@ def verify_strategy_config():
     return True
 
 
-def verify_system_integration():
+def verify_system_integration(orchestrator: MultiStrategyOrchestrator):
     """Verify complete system integration."""
     logger.info("🔍 Verifying System Integration...")
     
-    orchestrator = MultiStrategyOrchestrator()
-    
     # Check system status
     status = orchestrator.get_strategy_status()
     logger.info(f"System Status: {status}")
@@ -273,51 +294,59 @@ def verify_system_integration():
     return True
 
 
+def _run_verification(test_name: str, test_func) -> tuple:
+    """
+    Run one verification and return (test_name, passed, elapsed_ns).
+    Pass/fail is recorded, not logged; main() formats it in the summary.
+    """
+    logger.info(f"\n🔍 Running {test_name}...")
+    t0 = time.perf_counter_ns()
+    try:
+        result = bool(test_func())
+    except Exception as e:
+        logger.error(f"❌ {test_name} ERROR: {e}")
+        result = False
+    return test_name, result, time.perf_counter_ns() - t0
+
+
 def main():
     """Run comprehensive system verification."""
     logger.info("🚀 Starting Comprehensive System Verification")
     logger.info("=" * 60)
     
+    # Build the orchestrator once and share it across verifications
+    try:
+        orchestrator = MultiStrategyOrchestrator()
+        symbol_index = build_symbol_index(orchestrator)
+    except Exception as e:
+        logger.error(f"❌ Orchestrator initialization failed: {e}")
+        orchestrator = None
+        symbol_index = None
+    
     verification_tests = [
         ("Configuration", verify_configuration),
-        ("Symbol Tiers", verify_symbol_tiers),
-        ("Strategy Instances", verify_strategy_instances),
-        ("Symbol Data Handling", verify_symbol_data_handling),
-        ("Tier Controls", verify_tier_controls),
-        ("Position Sizing", verify_position_sizing),
-        ("Time Stops", verify_time_stops),
+        ("Symbol Tiers", lambda: verify_symbol_tiers(orchestrator)),
+        ("Strategy Instances", lambda: verify_strategy_instances(orchestrator, symbol_index)),
+        ("Symbol Data Handling", lambda: verify_symbol_data_handling(orchestrator)),
+        ("Tier Controls and Time Stops", lambda: verify_tier_controls_and_time_stops(orchestrator, symbol_index)),
+        ("Position Sizing", lambda: verify_position_sizing(symbol_index)),
         ("Strategy Configuration", verify_strategy_config),
-        ("System Integration", verify_system_integration),
+        ("System Integration", lambda: verify_system_integration(orchestrator)),
     ]
     
-    results = []
-    
-    for test_name, test_func in verification_tests:
-        logger.info(f"\n🔍 Running {test_name}...")
-        try:
-            result = test_func()
-            results.append((test_name, result))
-            if result:
-                logger.info(f"✅ {test_name} PASSED")
-            else:
-                logger.error(f"❌ {test_name} FAILED")
-        except Exception as e:
-            logger.error(f"❌ {test_name} ERROR: {e}")
-            results.append((test_name, False))
-    
-    # Summary
-    logger.info("\n" + "=" * 60)
-    logger.info("COMPREHENSIVE SYSTEM VERIFICATION SUMMARY")
-    logger.info("=" * 60)
-    
-    passed = sum(1 for _, result in results if result)
-    total = len(results)
+    events = [_run_verification(test_name, test_func) for test_name, test_func in verification_tests]
     
-    for test_name, result in results:
-        status = "PASS" if result else "FAIL"
-        logger.info(f"{test_name}: {status}")
+    # Summary, formatted once from the recorded events
+    passed = sum(result for _, result, _ in events)
+    total = len(events)
     
-    logger.info(f"\nOverall: {passed}/{total} verifications passed")
+    summary = ["", "=" * 60, "COMPREHENSIVE SYSTEM VERIFICATION SUMMARY", "=" * 60]
+    summary.extend(
+        f"{'✅' if result else '❌'} {test_name}: {'PASS' if result else 'FAIL'} ({elapsed_ns / 1e6:.1f} ms)"
+        for test_name, result, elapsed_ns in events
+    )
+    summary.append(f"\nOverall: {passed}/{total} verifications passed")
+    logger.info("\n".join(summary))
     
     if passed == total:
         logger.info("🎉 ALL VERIFICATIONS PASSED! System is fully operational.")